@@ -13,107 +13,237 @@ import re
 import sys
 import os
 import json
+import mmap
+import multiprocessing
+import string
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
 
 
-# STRICT regex for CAN ID 0402 only (DLC=8)
-RE_0402 = re.compile(
-    r"\b0402\b\s+8\s+((?:[0-9A-Fa-f]{2}\s+){4})"
+# Bump whenever the parsing or the output of parse_firmware_versions changes;
+# the launcher keys its persisted result cache on it.
+CACHE_VERSION = 1
+
+
+# A CAN ID, its DLC and data bytes b0..b3 (plus b4, None when the frame is
+# shorter), matched as bytes straight over the mapped file. Frames with fewer
+# than 4 data bytes carry nothing we read and are not matched at all.
+# Whitespace is [^\S\n] so a match never runs into the next line; the last data
+# byte may end right at the newline.
+_HEX_BYTE = rb"[0-9A-Fa-f]{2}"
+_SEP = rb"(?:[^\S\n]+|(?=\n))"
+
+
+def _frame_re(ids, b0=_HEX_BYTE):
+    return re.compile(
+        rb"\b(?P<id>" + rb"|".join(ids) + rb")\b[^\S\n]+(?P<dlc>\d+)[^\S\n]+"
+        rb"(?P<b0>" + b0 + rb")" + _SEP
+        + rb"(?P<b1>" + _HEX_BYTE + rb")" + _SEP
+        + rb"(?P<b2>" + _HEX_BYTE + rb")" + _SEP
+        + rb"(?P<b3>" + _HEX_BYTE + rb")" + _SEP
+        + rb"(?:(?P<b4>" + _HEX_BYTE + rb")" + _SEP + rb")?"
+    )
+
+
+# Firmware/config frames, scanned forwards until every field is found.
+# byte0 is the sub-function; only 00/02/04 select a field, so other values
+# are rejected by the regex itself.
+RE_FW_FRAME = _frame_re([b"07A1", b"07A2", b"07A3", b"07B1", b"012F"], b0=rb"0[024]")
+
+# 0402 (distance) is located with a plain substring search and only then matched
+# in place; it is only accepted with DLC=8, checked after the match.
+ID_0402 = b"0402"
+RE_0402 = _frame_re([ID_0402])
+
+# Two hex digits (any case) -> byte value, instead of int(x, 16) per byte
+_HEX = {
+    (hi + lo).encode("ascii"): int(hi + lo, 16)
+    for hi in string.hexdigits for lo in string.hexdigits
+}
+
+# Firmware/config fields reported by parse_firmware_versions, one bit each
+FW_FIELDS = (
+    "BMS_HW", "BMS_FIRMWARE", "BMS_CONFIG_ID", "BMS_GITSHA", "BMS_MANIFEST",
+    "STARK_FIRMWARE", "STARK_CONFIG", "XAVIER_FIRMWARE",
 )
+FIELD_BITS = {name: 1 << i for i, name in enumerate(FW_FIELDS)}
+ALL_FIELDS_MASK = (1 << len(FW_FIELDS)) - 1
+
+# (CAN ID, byte0 sub-function) -> field carried by that frame
+FIELD_BY_FRAME = {
+    # 07A1: Firmware Versions, byte0 selects the ECU
+    (b"07A1", b"02"): "BMS_FIRMWARE",
+    (b"07A1", b"00"): "STARK_FIRMWARE",
+    (b"07A1", b"04"): "XAVIER_FIRMWARE",
+    # 07A2: BMS Hardware
+    (b"07A2", b"02"): "BMS_HW",
+    # 07A3: CONFIG IDs
+    (b"07A3", b"02"): "BMS_CONFIG_ID",
+    (b"07A3", b"00"): "STARK_CONFIG",
+    # 07B1: BMS GitSha
+    (b"07B1", b"02"): "BMS_GITSHA",
+    # 012F: BMS Manifest
+    (b"012F", b"02"): "BMS_MANIFEST",
+}
+
+# Logs at least this big have the firmware scan split across worker processes
+# when the first segment does not already hold every field (standalone runs
+# only). An in-process scan covers ~100 MiB/s, so at 1 GiB it takes ~10 s
+# against well under a second to spawn the workers; below that the pool's
+# start-up eats most of the gain.
+PARALLEL_MIN_BYTES = 1024 * 1024 * 1024
+
+
+@contextmanager
+def _mapped(trc_path):
+    """Read-only mmap of the TRC file (empty files cannot be mapped)."""
+    with open(trc_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _distance_km(m):
+    """Odometer reading of a matched 0402 frame, or None if it is not DLC=8."""
+    if m.group("dlc") != b"8":
+        return None
+    b0, b1, b2, b3 = m.group("b0", "b1", "b2", "b3")
+    # 32-bit little-endian odometer, 0.1 km per bit
+    return (_HEX[b3] << 24 | _HEX[b2] << 16 | _HEX[b1] << 8 | _HEX[b0]) * 0.1
+
+
+def _version(b1, b2, b3):
+    """Dotted upper-case version string from three captured hex bytes."""
+    return b".".join((b1, b2, b3)).upper().decode("ascii")
+
+
+def _match_0402(buf, pos):
+    """Distance of a valid 0402 frame whose ID starts at pos, else None."""
+    m = RE_0402.match(buf, pos)
+    return _distance_km(m) if m else None
 
 
-def parse_firmware_versions(trc_path):
+def _read_first_distance(buf):
+    """
+    Find the first valid 0402 frame.
+    Returns (distance_km, offset) or (None, None).
+    """
+    pos = buf.find(ID_0402)
+    while pos != -1:
+        dist_km = _match_0402(buf, pos)
+        if dist_km is not None:
+            return dist_km, pos
+        pos = buf.find(ID_0402, pos + 1)
+    return None, None
+
+
+def _read_last_distance(buf, start_offset):
+    """Scan backwards from the end of buf (down to start_offset) for the last valid 0402 frame."""
+    pos = buf.rfind(ID_0402, start_offset)
+    while pos != -1:
+        dist_km = _match_0402(buf, pos)
+        if dist_km is not None:
+            return dist_km
+        pos = buf.rfind(ID_0402, start_offset, pos)
+    return None
+
+
+def _scan_fields(buf, begin, end):
+    """First value of each firmware/config field within buf[begin:end]."""
+    fields = {}
+    found = 0
+
+    for m in RE_FW_FRAME.finditer(buf, begin, end):
+        name = FIELD_BY_FRAME.get(m.group("id", "b0"))
+        if name is None or name in fields:
+            continue
+        b1, b2, b3, b4 = m.group("b1", "b2", "b3", "b4")
+
+        if name != "BMS_GITSHA":
+            fields[name] = _version(b1, b2, b3)
+        elif b4 is not None:
+            fields[name] = b"".join((b1, b2, b3, b4)).upper().decode("ascii")
+        else:
+            continue
+        found |= FIELD_BITS[name]
+
+        if found == ALL_FIELDS_MASK:
+            break
+
+    return fields
+
+
+def _scan_segment(trc_path, begin, end):
+    """Worker process entry point: map the file and scan one segment."""
+    with _mapped(trc_path) as buf:
+        return _scan_fields(buf, begin, end)
+
+
+def _segments(buf):
+    """Split buf into (begin, end) ranges on line boundaries, one per CPU for big logs."""
+    size = len(buf)
+    count = os.cpu_count() or 1
+    if not size or size < PARALLEL_MIN_BYTES or count < 2:
+        return [(0, size)]
+
+    bounds = [0]
+    for i in range(1, count):
+        nl = buf.find(b"\n", max(bounds[-1], size * i // count))
+        if nl == -1:
+            break
+        bounds.append(nl + 1)
+    bounds.append(size)
+    return [(b, e) for b, e in zip(bounds, bounds[1:]) if b < e]
+
+
+def parse_firmware_versions(trc_path, parallel=False):
+    """
+    Firmware/config fields and 0402 distance of a TRC. With parallel=True, big
+    logs missing fields after the first segment have the rest scanned by worker
+    processes; only the standalone script does that, callers inside another
+    application (the launcher GUI) scan every segment in-process.
+    """
     if not os.path.exists(trc_path):
         return {"error": f"TRC file not found: {trc_path}"}
 
-    # Storage
-    bms_hw = bms_fw = bms_cfg = bms_git = bms_manifest = None
-    stark_fw = stark_cfg = xavier_fw = None
-
     # Distance
     initial_distance = None
     final_distance = None
 
-    def all_found():
-        return all([
-            bms_hw, bms_fw, bms_cfg, bms_git, bms_manifest,
-            stark_fw, stark_cfg, xavier_fw
-        ])
-
-    with open(trc_path, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-
-            # ------------------------ STRICT 0402 Distance ------------------------
-            m = RE_0402.search(line)
-            if m:
-                p = m.group(1).split()
-                if len(p) == 4:
-                    raw = (
-                        int(p[0],16)
-                        | (int(p[1],16) << 8)
-                        | (int(p[2],16) << 16)
-                        | (int(p[3],16) << 24)
-                    )
-                    dist_km = raw * 0.1
-
-                    if initial_distance is None:
-                        initial_distance = dist_km
-                    final_distance = dist_km
-
-            # -------------------- 07A1: Firmware Versions --------------------
-            if "07A1" in line:
-                m = re.match(r".*?\b07A1\b\s+\d+\s+((?:[0-9A-Fa-f]{2}\s+){1,8})", line)
-                if m:
-                    p = m.group(1).split()
-                    if len(p) >= 4:
-                        byte0 = int(p[0], 16)
-                        ver = f"{int(p[1],16):02X}.{int(p[2],16):02X}.{int(p[3],16):02X}"
-
-                        if byte0 == 2 and bms_fw is None:
-                            bms_fw = ver
-                        elif byte0 == 0 and stark_fw is None:
-                            stark_fw = ver
-                        elif byte0 == 4 and xavier_fw is None:
-                            xavier_fw = ver
-
-            # -------------------- 07A2: BMS Hardware --------------------
-            if bms_hw is None and "07A2" in line:
-                m = re.match(r".*?\b07A2\b\s+\d+\s+((?:[0-9A-Fa-f]{2}\s+){1,8})", line)
-                if m:
-                    p = m.group(1).split()
-                    if len(p) >= 4 and p[0].upper() == "02":
-                        bms_hw = f"{int(p[1],16):02X}.{int(p[2],16):02X}.{int(p[3],16):02X}"
-
-            # -------------------- 07A3: CONFIG IDs --------------------
-            if "07A3" in line:
-                m = re.match(r".*?\b07A3\b\s+\d+\s+((?:[0-9A-Fa-f]{2}\s+){1,8})", line)
-                if m:
-                    p = m.group(1).split()
-
-                    if bms_cfg is None and len(p) >= 4 and p[0].upper() == "02":
-                        bms_cfg = f"{int(p[1],16):02X}.{int(p[2],16):02X}.{int(p[3],16):02X}"
-
-                    if stark_cfg is None and len(p) >= 4 and p[0].upper() == "00":
-                        stark_cfg = f"{int(p[1],16):02X}.{int(p[2],16):02X}.{int(p[3],16):02X}"
-
-            # -------------------- 07B1: BMS GitSha --------------------
-            if bms_git is None and "07B1" in line:
-                m = re.match(r".*?\b07B1\b\s+\d+\s+((?:[0-9A-Fa-f]{2}\s+){1,8})", line)
-                if m:
-                    p = m.group(1).split()
-                    if len(p) >= 5 and p[0].upper() == "02":
-                        bms_git = "".join(p[1:5]).upper()
-
-            # -------------------- 012F: BMS Manifest --------------------
-            if bms_manifest is None and "012F" in line:
-                m = re.match(r".*?\b012F\b\s+\d+\s+((?:[0-9A-Fa-f]{2}\s+){1,8})", line)
-                if m:
-                    p = m.group(1).split()
-                    if len(p) >= 4 and p[0].upper() == "02":
-                        bms_manifest = f"{int(p[1],16):02X}.{int(p[2],16):02X}.{int(p[3],16):02X}"
-
-            if all_found():
-                # DO NOT BREAK → allow scanning full file for final 0402
-                pass
+    with _mapped(trc_path) as buf:
+        # ------------------------ STRICT 0402 Distance ------------------------
+        # First and last readings only; the final scan stops at the first one
+        initial_distance, first_offset = _read_first_distance(buf)
+        if first_offset is not None:
+            final_distance = _read_last_distance(buf, first_offset)
+
+        # -------------------- Firmware / Config Frames --------------------
+        # Fields usually all show up early in the log, so the first segment is
+        # scanned here and the rest only if something is missing
+        segments = _segments(buf) if parallel else [(0, len(buf))]
+        fields = _scan_fields(buf, *segments[0])
+        rest = segments[1:]
+
+        if rest and len(fields) < len(FW_FIELDS):
+            begins, ends = zip(*rest)
+            try:
+                with ProcessPoolExecutor(max_workers=len(rest)) as ex:
+                    parts = list(ex.map(_scan_segment, repeat(trc_path), begins, ends))
+            except (OSError, BrokenProcessPool):
+                parts = [_scan_fields(buf, b, e) for b, e in rest]
+
+            # Earlier segments win, same as a single forward scan
+            for part in parts:
+                for name, value in part.items():
+                    fields.setdefault(name, value)
 
     # Final distance delta
     if initial_distance is not None and final_distance is not None:
@@ -122,14 +252,7 @@ def parse_firmware_versions(trc_path):
         distance_covered = None
 
     return {
-        "BMS_HW": bms_hw,
-        "BMS_FIRMWARE": bms_fw,
-        "BMS_CONFIG_ID": bms_cfg,
-        "BMS_GITSHA": bms_git,
-        "BMS_MANIFEST": bms_manifest,
-        "STARK_FIRMWARE": stark_fw,
-        "STARK_CONFIG": stark_cfg,
-        "XAVIER_FIRMWARE": xavier_fw,
+        **{name: fields.get(name) for name in FW_FIELDS},
 
         "DIST_INITIAL_KM": initial_distance,
         "DIST_FINAL_KM": final_distance,
@@ -143,9 +266,10 @@ def main():
         return
 
     trc_path = sys.argv[1]
-    info = parse_firmware_versions(trc_path)
-    print(json.dumps(info))
+    info = parse_firmware_versions(trc_path, parallel=True)
+    print(orjson.dumps(info).decode() if orjson else json.dumps(info))
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # worker processes of a frozen EXE build
     main()
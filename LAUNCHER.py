@@ -4,17 +4,28 @@ import subprocess
 import json
 import csv
 import math
-from typing import Dict, Optional, Set
+import locale
+import atexit
+import tempfile
+import time
+from collections import deque
+from typing import Deque, Dict, NamedTuple, Optional, Set, Tuple
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QComboBox,
     QFileDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QMessageBox,
     QGridLayout, QTableWidget, QTableWidgetItem, QFrame, QDialog,
-    QTextEdit, QHeaderView, QAbstractItemView
+    QPlainTextEdit, QHeaderView, QAbstractItemView
 )
-from PySide6.QtGui import QFont, QPixmap, QColor, QLinearGradient, QBrush, QPalette
-from PySide6.QtCore import Qt, QThread, Signal, QProcess, QTimer
+from PySide6.QtGui import QFont, QColor, QLinearGradient, QBrush, QPalette
+from PySide6.QtCore import Qt, QEvent, QObject, QRunnable, QThreadPool, Signal, QProcess, QProcessEnvironment, QTimer, QFileSystemWatcher
 from updater import check_for_update
+from FW_Config_checker import CACHE_VERSION as FW_CACHE_VERSION
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
 
 
 # -------------------------------------------------------
@@ -29,8 +40,9 @@ TEST_CASES = [
     "SoC vs VOLTAGE SUMMARY", "CAPACITY + SoC vs RANGE CHECK", "BMS CURRENT IN READY MODE", "DRIVE_CHARGE Max Min Avg CURRENT"
 ]
 
-FW_CHECKER = "FW_Config_checker.py"
 CLEAR_OUTPUTS_ON_RUN_ALL = True  # set to False to keep previous outputs
+MAX_CONCURRENT_TESTS = os.cpu_count() or 4  # RUN ALL starts at most this many scripts at once
+FW_CHECKER = os.path.join(os.path.dirname(os.path.realpath(__file__)), "FW_Config_checker.py")
 
 # row -> script filename (inside a folder of the same base name)
 SCRIPT_BY_ROW: Dict[int, str] = {
@@ -62,10 +74,104 @@ def _default_output_names(script_name: str) -> Dict[str, str]:
         "graph": f"{base}_plot.png",
     }
 
-# Allow scripts ~4.5 seconds (9 * 0.5s) to persist their JSON outputs
+class TestSpec(NamedTuple):
+    name: str                 # TEST_CASES label
+    script: str               # script file name
+    folder: str               # folder holding the script, same base name
+    defaults: Dict[str, str]  # output file names when file_name.json has no entry
+
+# One entry per table row, derived once from TEST_CASES / SCRIPT_BY_ROW
+TEST_ROWS: Tuple[TestSpec, ...] = tuple(
+    TestSpec(name, SCRIPT_BY_ROW[row], os.path.splitext(SCRIPT_BY_ROW[row])[0],
+             _default_output_names(SCRIPT_BY_ROW[row]))
+    for row, name in enumerate(TEST_CASES)
+)
+
+class ResetSection(NamedTuple):
+    label: str                # "VCU" / "BMS", used in messages
+    script: str               # reset-count script
+    output: str               # JSON the script writes
+    button: QPushButton
+    value_field: QLineEdit    # "Count : n"
+    result_field: QLineEdit   # PASS / FAIL
+
+def _read_json(path: str, encoding: Optional[str] = None, errors: str = "strict"):
+    """
+    Load a JSON file, via orjson when it is installed. Files that are not valid
+    UTF-8 (or orjson) fall back to json with the given text encoding
+    (locale default when None).
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode(encoding or locale.getpreferredencoding(False), errors))
+
+# Allow scripts ~4.5 seconds (9 * 0.5s) after exiting to persist their JSON outputs
 RESULT_POLL_ATTEMPTS = 9
 RESULT_POLL_DELAY_MS = 500
 
+# Result JSONs above this size are shown as written instead of parsed and re-indented
+JSON_PRETTY_MAX_BYTES = 256 * 1024
+
+def _button_glow_styles(edge: str, mid: str, shine: str, steps: int = 50):
+    """Pre-formatted moving-glow button stylesheets, one per animation position."""
+    styles = []
+    for i in range(steps):
+        highlight = i / steps
+        start = max(0.0, highlight - 0.2)
+        end = min(1.0, highlight + 0.2)
+        styles.append(
+            "color:white; font-weight:bold; padding:10px;"
+            "background:qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0,"
+            f"stop:0 {edge}, stop:{start:.2f} {mid}, stop:{highlight:.2f} {shine}, "
+            f"stop:{end:.2f} {mid}, stop:1 {edge});"
+        )
+    return tuple(styles)
+
+MAKE_BTN_GLOW_STYLES = _button_glow_styles("#001F6B", "#0033CC", "#4DE8FF")
+RUN_ALL_GLOW_STYLES = _button_glow_styles("#0A2F0A", "#0F6B0F", "#32CD32")
+
+# VCU/BMS reset field colours per result; any other result restores the default look
+RESULT_FIELD_COLORS = {"PASS": ("#28A745", "white"), "FAIL": ("#FF0000", "white")}
+RESULT_FIELD_STYLES = {
+    result: f"QLineEdit {{ background:{bg}; color:{fg}; font-weight:bold; }}"
+    for result, (bg, fg) in RESULT_FIELD_COLORS.items()
+}
+
+# FW check results per checker version and TRC identity, so re-selecting an unchanged
+# log skips the scan. Kept across sessions in the temp folder; hits move an entry to the
+# end, so only the FW_CACHE_MAX most recently used entries are saved.
+FW_CACHE_FILE = os.path.join(tempfile.gettempdir(), "canlog_fw_cache.json")
+FW_CACHE_MAX = 200
+
+def _fw_cache_key(trc_file: str) -> Optional[str]:
+    try:
+        st = os.stat(trc_file)
+    except OSError:
+        return None
+    return f"v{FW_CACHE_VERSION}|{os.path.abspath(trc_file)}|{st.st_mtime_ns}|{st.st_size}"
+
+def _load_fw_cache() -> Dict[str, dict]:
+    try:
+        data = _read_json(FW_CACHE_FILE)
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def _save_fw_cache():
+    entries = list(_fw_cache.items())[-FW_CACHE_MAX:]
+    try:
+        with open(FW_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(dict(entries), f)
+    except Exception:
+        pass
+
+_fw_cache: Dict[str, dict] = _load_fw_cache()
+
 # -------------------------------------------------------
 # JSON POPUP
 # -------------------------------------------------------
@@ -76,14 +182,22 @@ class JsonDialog(QDialog):
         self.resize(550, 380)
 
         layout = QVBoxLayout(self)
-        text = QTextEdit()
+        text = QPlainTextEdit()
         text.setReadOnly(True)
 
         if os.path.exists(json_path):
             try:
-                with open(json_path, "r", encoding="cp1252", errors="replace") as f:
-                    loaded = json.load(f)
-                pretty = json.dumps(loaded, indent=4, ensure_ascii=False)
+                if os.path.getsize(json_path) > JSON_PRETTY_MAX_BYTES:
+                    # Scripts already write indented JSON; skip the parse/dump round trip
+                    with open(json_path, "rb") as f:
+                        raw = f.read()
+                    try:
+                        pretty = raw.decode("utf-8")
+                    except UnicodeDecodeError:
+                        pretty = raw.decode("cp1252", errors="replace")
+                else:
+                    loaded = _read_json(json_path, encoding="cp1252", errors="replace")
+                    pretty = json.dumps(loaded, indent=4, ensure_ascii=False)
             except Exception as e:
                 pretty = f"Failed to load JSON:\n{e}"
         else:
@@ -97,133 +211,54 @@ class JsonDialog(QDialog):
         layout.addWidget(btn, alignment=Qt.AlignCenter)
 
 # -------------------------------------------------------
-# IMAGE POPUP
-# -------------------------------------------------------
-class ImageDialog(QDialog):
-    def __init__(self, image_path, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Graph")
-        self.resize(650, 480)
-
-        layout = QVBoxLayout(self)
-        label = QLabel()
-        label.setAlignment(Qt.AlignCenter)
-
-        if os.path.exists(image_path):
-            pix = QPixmap(image_path)
-            if not pix.isNull():
-                if pix.width() > 620 or pix.height() > 420:
-                    pix = pix.scaled(620, 420, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                label.setPixmap(pix)
-            else:
-                label.setText("Failed to load image.")
-        else:
-            label.setText(f"File not found:\n{image_path}")
-
-        layout.addWidget(label)
-
-        btn = QPushButton("Close")
-        btn.clicked.connect(self.accept)
-        layout.addWidget(btn, alignment=Qt.AlignCenter)
-
-# -------------------------------------------------------
-# FW CHECK THREAD
-# -------------------------------------------------------
-class FWCheckerThread(QThread):
-    finished_ok = Signal(dict)
-    finished_err = Signal(str)
-
-    def __init__(self, trc_file):
-        super().__init__()
-        self.trc_file = trc_file
-
-    def run(self):
-        try:
-            proc = subprocess.Popen(
-                [sys.executable, FW_CHECKER, self.trc_file],
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-            )
-            out, err = proc.communicate()
-
-            if proc.returncode != 0:
-                self.finished_err.emit(err)
-                return
-
-            try:
-                self.finished_ok.emit(json.loads(out))
-            except Exception:
-                self.finished_err.emit("Invalid FW JSON output")
-
-        except Exception as e:
-            self.finished_err.emit(str(e))
-
-# -------------------------------------------------------
-# VCU RESET THREAD
+# FW CHECK TASK
 # -------------------------------------------------------
-class VCUResetThread(QThread):
+class FWCheckerSignals(QObject):
     finished_ok = Signal(dict)
     finished_err = Signal(str)
+    finished = Signal()
 
-    def __init__(self, trc_file: str, script_path: str, output_path: str):
-        super().__init__()
-        self.trc_file = trc_file
-        self.script_path = script_path
-        self.output_path = output_path
 
-    def run(self):
-        try:
-            proc = subprocess.Popen(
-                [sys.executable, self.script_path, self.trc_file, self.output_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(self.script_path),
-            )
-            out, err = proc.communicate()
+class FWCheckerTask(QRunnable):
+    """
+    Runs on the scan thread pool and blocks on the FW checker process there;
+    results come back through self.signals.
+    """
 
-            if proc.returncode != 0:
-                self.finished_err.emit(err or out or "VCU reset script failed")
-                return
-
-            with open(self.output_path, "r", encoding="utf-8", errors="ignore") as f:
-                data = json.load(f)
-            self.finished_ok.emit(data)
-
-        except Exception as e:
-            self.finished_err.emit(str(e))
-
-
-class BMSResetThread(QThread):
-    finished_ok = Signal(dict)
-    finished_err = Signal(str)
-
-    def __init__(self, trc_file: str, script_path: str, output_path: str):
+    def __init__(self, trc_file):
         super().__init__()
         self.trc_file = trc_file
-        self.script_path = script_path
-        self.output_path = output_path
+        # Created on the GUI thread, so emits from the pool are queued back to it
+        self.signals = FWCheckerSignals()
 
     def run(self):
+        # The scan runs in its own interpreter; this thread only waits on the pipe,
+        # so the checker's regex/mmap work never holds the GUI process's GIL
         try:
-            proc = subprocess.Popen(
-                [sys.executable, self.script_path, self.trc_file, self.output_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(self.script_path),
-            )
-            out, err = proc.communicate()
-
-            if proc.returncode != 0:
-                self.finished_err.emit(err or out or "BMS reset script failed")
-                return
-
-            with open(self.output_path, "r", encoding="utf-8", errors="ignore") as f:
-                data = json.load(f)
-            self.finished_ok.emit(data)
-
+            key = _fw_cache_key(self.trc_file)
+            info = _fw_cache.pop(key, None) if key else None
+            if info is not None:
+                _fw_cache[key] = info  # re-insert as most recently used
+            else:
+                proc = subprocess.run(
+                    [sys.executable, FW_CHECKER, self.trc_file],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                )
+                if proc.returncode != 0:
+                    self.signals.finished_err.emit(proc.stderr.decode("utf-8", "replace"))
+                    return
+                try:
+                    info = orjson.loads(proc.stdout) if orjson else json.loads(proc.stdout)
+                except ValueError:
+                    self.signals.finished_err.emit("Invalid FW JSON output")
+                    return
+                if key and "error" not in info:
+                    _fw_cache[key] = info
+            self.signals.finished_ok.emit(dict(info))
         except Exception as e:
-            self.finished_err.emit(str(e))
+            self.signals.finished_err.emit(str(e))
+        finally:
+            self.signals.finished.emit()
 
 # -------------------------------------------------------
 # MAIN GUI
@@ -234,6 +269,20 @@ class CANLogDebugger(QWidget):
         self.setWindowTitle("CAN LOG ANALYSER")
         self.setMinimumSize(1250, 780)
 
+        # Shared by every table cell styling call instead of copying/parsing per cell
+        self.bold_font = QFont()
+        self.bold_font.setBold(True)
+        self.testcase_fg = QColor("#1FA37A")  # green text
+        self.testcase_bg = QColor("white")
+
+        # Read by the glow animation on every tick; real widgets/flags are set below
+        self.title_label: Optional[QLabel] = None
+        self.title_container: Optional[QFrame] = None
+        self.title_anim_timer: Optional[QTimer] = None
+        self.make_btn_animating = False
+        self.run_all_animating = False
+        self.test_table: Optional[QTableWidget] = None
+
         self.selected_file_path = ""
         self.script_dir = os.path.dirname(os.path.realpath(__file__))
         self.default_tests_folder = os.path.join(self.script_dir, "TRC TEST CASES")
@@ -245,14 +294,45 @@ class CANLogDebugger(QWidget):
         self.vcu_reset_output = os.path.join(self.script_dir, "TRC TEST CASES", "ECU RESET", "VCU_Reset_Result.json")
         self.bms_reset_script = os.path.join(self.script_dir, "TRC TEST CASES", "ECU RESET", "BMS_Reset.py")
         self.bms_reset_output = os.path.join(self.script_dir, "TRC TEST CASES", "ECU RESET", "BMS_Reset_Result.json")
+        # Reset scripts already seen on disk; only missing ones are stat'ed again on the next browse
+        self.reset_scripts_found: Set[str] = set()
         self.scan_tasks = 0
+        # Pool threads only wait on the FW checker process; the bound keeps rapid
+        # re-browsing from starting a checker interpreter per click
+        self.scan_pool = QThreadPool(self)
+        self.scan_pool.setMaxThreadCount(2)
         self.processes: Dict[int, QProcess] = {}
+        # Test scripts only save figures, so skip matplotlib's interactive backend lookup
+        # (and its Tk/Qt import) in every child interpreter
+        self.test_env = QProcessEnvironment.systemEnvironment()
+        self.test_env.insert("MPLBACKEND", "Agg")
+        self.queued_rows: Deque[int] = deque()
         self.running_rows: Set[int] = set()
-        self.output_files = self._load_output_config()
+        # file_name.json of every tests folder, read once up front
+        self.output_config_by_folder: Dict[str, Dict[int, Dict[str, str]]] = {
+            folder: self._load_output_config(folder)
+            for folder in {self.default_tests_folder, *self.tests_folder_overrides.values()}
+        }
+        self.output_files = self.output_config_by_folder[self.tests_folder]
+        # Resolved paths per row; cleared and refilled for each selected log, RUN ALL only reads them
+        self._script_path_cache: Dict[int, Tuple[Optional[str], Optional[str]]] = {}
+        self._output_path_cache: Dict[Tuple[int, str], Optional[str]] = {}
         self.pending_result_rows: Set[int] = set()
+        # Result JSONs are picked up when their folder/file changes; the timer is only a safety net
+        self.result_watcher = QFileSystemWatcher(self)
+        self.result_watcher.directoryChanged.connect(self._on_result_path_changed)
+        self.result_watcher.fileChanged.connect(self._on_result_path_changed)
+        self.watched_result_rows: Dict[str, Set[int]] = {}
         self.result_refresh_timer = QTimer(self)
-        self.result_refresh_timer.setInterval(1000)
+        self.result_refresh_timer.setInterval(5000)
         self.result_refresh_timer.timeout.connect(self._refresh_pending_results)
+        # Rows whose script has exited but whose JSON is not readable yet -> monotonic time at
+        # which the row is marked missing. The watcher delivers the JSON; this single-shot
+        # timer only fires at the earliest deadline.
+        self.result_deadlines: Dict[int, float] = {}
+        self.result_wait_timer = QTimer(self)
+        self.result_wait_timer.setSingleShot(True)
+        self.result_wait_timer.timeout.connect(self._expire_result_waits)
 
         # ---------------- TITLE ----------------
         self.version_label = QLabel(self._read_version_text())
@@ -295,8 +375,6 @@ class CANLogDebugger(QWidget):
         self.make_btn = QPushButton("MAKE YOUR LOGS ORGANISED")
         self.make_btn.setStyleSheet("background:#FF0000; color:white; font-weight:bold;")
         self.make_btn.clicked.connect(self.on_make_logs)
-        self.make_btn_animating = False
-        self.run_all_animating = False
 
         self.run_all_btn = QPushButton("RUN ALL TEST CASES")
         self.run_all_btn.setEnabled(False)
@@ -381,11 +459,24 @@ class CANLogDebugger(QWidget):
         for t in [self.tx_vcu_value, self.tx_vcu_result, self.tx_bms_value, self.tx_bms_result]:
             t.setReadOnly(True)
 
-        # Store default palettes so we can restore styles cleanly
-        self.vcu_value_palette_default = self.tx_vcu_value.palette()
-        self.vcu_result_palette_default = self.tx_vcu_result.palette()
-        self.bms_value_palette_default = self.tx_bms_value.palette()
-        self.bms_result_palette_default = self.tx_bms_result.palette()
+        # Palette per result for each reset field, built once from its default palette
+        # (kept under None so styles can be restored cleanly)
+        self.result_field_palettes: Dict[QLineEdit, Dict[Optional[str], QPalette]] = {}
+        for t in [self.tx_vcu_value, self.tx_vcu_result, self.tx_bms_value, self.tx_bms_result]:
+            palettes = {None: t.palette()}
+            for result, (bg, fg) in RESULT_FIELD_COLORS.items():
+                pal = QPalette(palettes[None])
+                pal.setColor(QPalette.Base, QColor(bg))
+                pal.setColor(QPalette.Text, QColor(fg))
+                palettes[result] = pal
+            self.result_field_palettes[t] = palettes
+
+        # VCU and BMS reset checks run through the same code, one section each
+        self.vcu_reset = ResetSection("VCU", self.vcu_reset_script, self.vcu_reset_output,
+                                      self.btn_vcu, self.tx_vcu_value, self.tx_vcu_result)
+        self.bms_reset = ResetSection("BMS", self.bms_reset_script, self.bms_reset_output,
+                                      self.btn_bms, self.tx_bms_value, self.tx_bms_result)
+        self.reset_procs: Dict[str, QProcess] = {}
 
         # Auto-driven; disable manual clicks
         self.btn_vcu.setEnabled(False)
@@ -533,73 +624,104 @@ class CANLogDebugger(QWidget):
         self.title_label = label
         self.title_container = container
         self.title_anim_step = 0
+        self.title_glow_colors = (QColor("#001F6B"), QColor("#0033CC"), QColor("#4DE8FF"))
+        self.running_glow_colors = (QColor("#00124F"), QColor("#4DE8FF"))
+        if container is not None:
+            # The glow is painted through the palette, so each frame only swaps a
+            # brush instead of re-parsing a stylesheet for the whole title bar
+            container.setAutoFillBackground(True)
+            if getattr(self, "version_label", None):
+                self.version_label.setStyleSheet(
+                    "color:white; padding:0 12px; font-weight:bold; background:transparent;"
+                )
         self.title_anim_timer = QTimer(self)
         self.title_anim_timer.timeout.connect(self._update_title_glow)
         self.title_anim_timer.start(120)
         self._update_title_glow()
 
     def _update_title_glow(self):
-        if not getattr(self, "title_label", None):
+        if self.title_label is None:
             return
         self.title_anim_step = (self.title_anim_step + 1) % 100
         highlight = self.title_anim_step / 100.0
         start = max(0.0, highlight - 0.2)
         end = min(1.0, highlight + 0.2)
-        gradient = (
-            "qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0,"
-            f"stop:0 #001F6B, stop:{start:.2f} #0033CC, stop:{highlight:.2f} #4DE8FF, "
-            f"stop:{end:.2f} #0033CC, stop:1 #001F6B)"
-        )
-        style = (
-            "color:#00FFFF; padding:10px; font-weight:bold;"
-            f"background:{gradient};"
-        )
-        if getattr(self, "title_container", None):
-            self.title_container.setStyleSheet(f"background:{gradient}; border:0px;")
+        if self.title_container is not None:
+            edge, mid, shine = self.title_glow_colors
+            g = QLinearGradient(0, 0, 1, 0)
+            g.setCoordinateMode(QLinearGradient.ObjectBoundingMode)
+            g.setColorAt(0.0, edge)
+            g.setColorAt(start, mid)
+            g.setColorAt(highlight, shine)
+            g.setColorAt(end, mid)
+            g.setColorAt(1.0, edge)
+            pal = self.title_container.palette()
+            pal.setBrush(QPalette.Window, QBrush(g))
+            self.title_container.setPalette(pal)
+        else:
+            gradient = (
+                "qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0,"
+                f"stop:0 #001F6B, stop:{start:.2f} #0033CC, stop:{highlight:.2f} #4DE8FF, "
+                f"stop:{end:.2f} #0033CC, stop:1 #001F6B)"
+            )
             self.title_label.setStyleSheet(
-                "color:#00FFFF; padding:10px; font-weight:bold; background:transparent;"
+                "color:#00FFFF; padding:10px; font-weight:bold;"
+                f"background:{gradient};"
             )
-            if getattr(self, "version_label", None):
-                self.version_label.setStyleSheet(
-                    "color:white; padding:0 12px; font-weight:bold; background:transparent;"
-                )
-        else:
-            self.title_label.setStyleSheet(style)
+
+        # Button glows move in coarser steps; the stylesheet is only re-applied
+        # (and re-parsed by Qt) when the step actually changes
+        glow_idx = self.title_anim_step * len(MAKE_BTN_GLOW_STYLES) // 100
 
         # Mirror the running glow on the log organiser button while active
-        if getattr(self, "make_btn_animating", False) and getattr(self, "make_btn", None):
-            btn_style = (
-                "color:white; font-weight:bold; padding:10px;"
-                "background:qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0,"
-                f"stop:0 #001F6B, stop:{start:.2f} #0033CC, stop:{highlight:.2f} #4DE8FF, "
-                f"stop:{end:.2f} #0033CC, stop:1 #001F6B);"
-            )
-            self.make_btn.setStyleSheet(btn_style)
+        if self.make_btn_animating:
+            btn_style = MAKE_BTN_GLOW_STYLES[glow_idx]
+            if self.make_btn.styleSheet() != btn_style:
+                self.make_btn.setStyleSheet(btn_style)
 
         # Apply a green running glow to the RUN ALL button while tests are running
-        if getattr(self, "run_all_animating", False) and getattr(self, "run_all_btn", None):
-            run_style = (
-                "color:white; font-weight:bold; padding:10px;"
-                "background:qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0,"
-                f"stop:0 #0A2F0A, stop:{start:.2f} #0F6B0F, stop:{highlight:.2f} #32CD32, "
-                f"stop:{end:.2f} #0F6B0F, stop:1 #0A2F0A);"
-            )
-            self.run_all_btn.setStyleSheet(run_style)
+        if self.run_all_animating:
+            run_style = RUN_ALL_GLOW_STYLES[glow_idx]
+            if self.run_all_btn.styleSheet() != run_style:
+                self.run_all_btn.setStyleSheet(run_style)
 
         # Apply running reflection on status cells
-        if getattr(self, "running_rows", None) and getattr(self, "test_table", None):
-            phase = self.title_anim_step / 100.0
+        if self.running_rows and self.test_table is not None:
+            # Same reflection for every running row, so build the brush once per tick
+            brush = self._running_brush(self.title_anim_step / 100.0)
             for row in list(self.running_rows):
-                self._set_running_visual(row, phase)
+                self._set_running_visual(row, brush)
+
+    def _sync_title_animation(self):
+        """Run the glow timer only while the window can actually be seen."""
+        timer = self.title_anim_timer
+        if timer is None:
+            return
+        if self.isVisible() and not self.isMinimized():
+            if not timer.isActive():
+                timer.start(120)
+        elif timer.isActive():
+            timer.stop()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_title_animation()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sync_title_animation()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._sync_title_animation()
 
     def _set_colored_cell(self, row: int, col: int, text: str, bg_color: str, align=Qt.AlignCenter, tooltip=None):
         item = QTableWidgetItem(text)
         item.setTextAlignment(align)
         item.setForeground(QColor("white"))
         item.setBackground(QColor(bg_color))
-        font = item.font()
-        font.setBold(True)
-        item.setFont(font)
+        item.setFont(self.bold_font)
         if tooltip:
             item.setToolTip(tooltip)
         self.test_table.setItem(row, col, item)
@@ -615,14 +737,9 @@ class CANLogDebugger(QWidget):
         b = int(c1.blue() + (c2.blue() - c1.blue()) * t)
         return QColor(r, g, b)
 
-    def _set_running_visual(self, row: int, phase: float):
-        """Animate running status cell with a moving light-blue reflection and static text."""
-        item = self.test_table.item(row, 1)
-        if not item:
-            return
-        item.setText("Running")
-        base = QColor("#00124F")
-        shine = QColor("#4DE8FF")
+    def _running_brush(self, phase: float) -> QBrush:
+        """Moving light-blue reflection for running status cells."""
+        base, shine = self.running_glow_colors
         pos = phase % 1.0
         band = 0.18
         # smooth easing for the band movement
@@ -635,25 +752,57 @@ class CANLogDebugger(QWidget):
         g.setColorAt(center, shine)
         g.setColorAt(min(1.0, center + band), base)
         g.setColorAt(1.0, base)
-        item.setBackground(QBrush(g))
+        return QBrush(g)
+
+    def _set_running_visual(self, row: int, brush: QBrush):
+        """Animate running status cell with the current reflection brush and static text."""
+        item = self.test_table.item(row, 1)
+        if not item:
+            return
+        item.setText("Running")
+        item.setBackground(brush)
         item.setForeground(QColor("white"))
-        font = item.font()
-        font.setBold(True)
-        item.setFont(font)
+        item.setFont(self.bold_font)
 
     def _ensure_result_timer_running(self):
         if self.pending_result_rows:
             if not self.result_refresh_timer.isActive():
                 self.result_refresh_timer.start()
-        elif self.result_refresh_timer.isActive():
-            self.result_refresh_timer.stop()
+        else:
+            if self.result_refresh_timer.isActive():
+                self.result_refresh_timer.stop()
+            watched = self.result_watcher.files() + self.result_watcher.directories()
+            if watched:
+                self.result_watcher.removePaths(watched)
+            self.watched_result_rows.clear()
+
+    def _watch_path_for_row(self, path: str, row: int):
+        self.watched_result_rows.setdefault(path, set()).add(row)
+        # Qt drops a watched file once it is deleted, so re-add when needed
+        if path not in self.result_watcher.files() and path not in self.result_watcher.directories():
+            self.result_watcher.addPath(path)
+
+    def _watch_result_row(self, row: int):
+        """Watch the result JSON of a pending row (its folder until the file exists)."""
+        result_path = self._get_result_file_path(row)
+        if not result_path:
+            return
+        self._watch_path_for_row(os.path.dirname(result_path), row)
+        if os.path.exists(result_path):
+            # Catch the write that completes a file created half-written
+            self._watch_path_for_row(result_path, row)
+
+    def _on_result_path_changed(self, path: str):
+        for row in list(self.watched_result_rows.get(path, ())):
+            if row in self.pending_result_rows and not self.update_result_cell(row):
+                self._watch_result_row(row)
 
     def _maybe_finish_run_all(self):
         """
         Re-enable the RUN ALL button only after all processes have stopped
         and pending result rows have been consumed.
         """
-        if not self.processes:
+        if not self.processes or self.queued_rows:
             return
         if any(p.state() != QProcess.NotRunning for p in self.processes.values()):
             return
@@ -668,19 +817,22 @@ class CANLogDebugger(QWidget):
         if not self.pending_result_rows:
             self._ensure_result_timer_running()
             return
-        for row in list(self.pending_result_rows):
-            self.update_result_cell(row)
+        # Repaint the table once for all rows updated in this pass
+        self.test_table.setUpdatesEnabled(False)
+        try:
+            for row in list(self.pending_result_rows):
+                self.update_result_cell(row)
+        finally:
+            self.test_table.setUpdatesEnabled(True)
         self._ensure_result_timer_running()
 
     def _style_testcase_cell(self, item: QTableWidgetItem):
         """Style visible test case names."""
         if not item:
             return
-        item.setForeground(QColor("#1FA37A"))  # green text
-        item.setBackground(QColor("white"))
-        font = item.font()
-        font.setBold(True)
-        item.setFont(font)
+        item.setForeground(self.testcase_fg)
+        item.setBackground(self.testcase_bg)
+        item.setFont(self.bold_font)
 
     def _get_test_script_paths(self, row: int):
         """
@@ -688,10 +840,16 @@ class CANLogDebugger(QWidget):
         Folder name is assumed to be base name of script.
         E.g. SoC_behavior.py -> TRC TEST CASES/SoC_behavior/SoC_behavior.py
         """
-        script_name = SCRIPT_BY_ROW.get(row)
-        if not script_name:
+        cached = self._script_path_cache.get(row)
+        if cached is None:
+            cached = self._script_path_cache[row] = self._resolve_test_script_paths(row)
+        return cached
+
+    def _resolve_test_script_paths(self, row: int):
+        if not 0 <= row < len(TEST_ROWS):
             return None, None
-        folder_name = os.path.splitext(script_name)[0]
+        spec = TEST_ROWS[row]
+        script_name, folder_name = spec.script, spec.folder
 
         # Primary path based on selected file type
         folder_path = os.path.join(self.tests_folder, folder_name)
@@ -714,24 +872,27 @@ class CANLogDebugger(QWidget):
         new_folder = self._tests_folder_for_extension(ext)
         if new_folder != self.tests_folder:
             self.tests_folder = new_folder
-            self.output_files = self._load_output_config()
+            self.output_files = self.output_config_by_folder[new_folder]
+            self._clear_path_caches()
+
+    def _clear_path_caches(self):
+        self._script_path_cache.clear()
+        self._output_path_cache.clear()
 
-    def _load_output_config(self) -> Dict[int, Dict[str, str]]:
-        config_path = os.path.join(self.tests_folder, "file_name.json")
+    def _load_output_config(self, tests_folder: str) -> Dict[int, Dict[str, str]]:
+        config_path = os.path.join(tests_folder, "file_name.json")
         config_data: Dict[str, Dict[str, str]] = {}
         if os.path.exists(config_path):
             try:
-                with open(config_path, "r") as f:
-                    raw = json.load(f)
+                raw = _read_json(config_path)
                 config_data = {k.lower(): v for k, v in raw.items() if isinstance(v, dict)}
             except Exception:
                 config_data = {}
 
         output_by_row: Dict[int, Dict[str, str]] = {}
-        for row, script_name in SCRIPT_BY_ROW.items():
-            test_name = TEST_CASES[row].lower()
-            entry = config_data.get(test_name, {})
-            defaults = _default_output_names(script_name)
+        for row, spec in enumerate(TEST_ROWS):
+            entry = config_data.get(spec.name.lower(), {})
+            defaults = spec.defaults
             output_by_row[row] = {
                 "result": entry.get("result", defaults["result"]),
                 "summary": entry.get("summary", defaults["summary"]),
@@ -740,6 +901,12 @@ class CANLogDebugger(QWidget):
         return output_by_row
 
     def _get_output_file_path(self, row: int, kind: str) -> Optional[str]:
+        key = (row, kind)
+        if key not in self._output_path_cache:
+            self._output_path_cache[key] = self._resolve_output_file_path(row, kind)
+        return self._output_path_cache[key]
+
+    def _resolve_output_file_path(self, row: int, kind: str) -> Optional[str]:
         folder_path, _ = self._get_test_script_paths(row)
         if not folder_path:
             return None
@@ -752,15 +919,31 @@ class CANLogDebugger(QWidget):
         return self._get_output_file_path(row, "result")
 
     def _clear_all_outputs(self):
-        """Delete previously generated result/summary/graph files for all test cases."""
-        for row, files in self.output_files.items():
+        """Delete previously generated result/summary/graph files and run logs for all test cases."""
+        names_by_folder: Dict[str, Set[str]] = {}
+        for row in self.output_files:
             for kind in ("result", "summary", "graph"):
                 path = self._get_output_file_path(row, kind)
-                if path and os.path.exists(path):
-                    try:
-                        os.remove(path)
-                    except Exception:
-                        pass
+                if path:
+                    folder, name = os.path.split(path)
+                    names_by_folder.setdefault(folder, set()).add(os.path.normcase(name))
+        for row, spec in enumerate(TEST_ROWS):
+            folder_path, _ = self._get_test_script_paths(row)
+            if folder_path:
+                names_by_folder.setdefault(folder_path, set()).add(os.path.normcase(f"{spec.folder}_run.log"))
+
+        # One directory listing per test folder instead of a stat per output file
+        for folder, names in names_by_folder.items():
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if os.path.normcase(entry.name) in names:
+                            try:
+                                os.remove(entry.path)
+                            except Exception:
+                                pass
+            except OSError:
+                pass
 
     # ======================================================
     # MAKE LOGS ORGANISED
@@ -807,13 +990,25 @@ class CANLogDebugger(QWidget):
 
     def on_browse(self):
         ft = self.ft_combo.currentText()
-        path, _ = QFileDialog.getOpenFileName(self, "Select File", "", f"{ft} Files (*{ft})")
-
+        # open() returns immediately; the selection arrives via fileSelected
+        # instead of blocking this handler inside a nested modal loop
+        dlg = QFileDialog(self, "Select File", "", f"{ft} Files (*{ft})")
+        dlg.setFileMode(QFileDialog.ExistingFile)
+        dlg.setAttribute(Qt.WA_DeleteOnClose)
+        dlg.fileSelected.connect(self._on_file_selected)
+        dlg.open()
+
+    def _on_file_selected(self, path: str):
         if not path:
             return
 
         file_ext = os.path.splitext(path)[1].lower()
         self._set_tests_folder_for_extension(file_ext)
+        # Resolve every test script once per selected log (picks up scripts added or
+        # removed since the last browse); RUN ALL then only reads the cache
+        self._clear_path_caches()
+        for row in range(len(TEST_ROWS)):
+            self._get_test_script_paths(row)
 
         self.selected_file_path = path
         self.file_box.setText(path)
@@ -823,46 +1018,93 @@ class CANLogDebugger(QWidget):
         self.browse_btn.setEnabled(False)
         self.browse_btn.setText("Scanning...")
 
-        self._start_fw_scan(path)
-
         if file_ext == ".trc":
-            self._start_vcu_reset_check(path, track_scan=True)
+            self._start_fw_scan(path)
+            self._start_reset_check(self.vcu_reset, path, track_scan=True)
             self._start_bms_reset_check(path, track_scan=True)
         else:
-            self.reset_vcu_fields()
-            self.reset_bms_fields()
+            # FW frames only exist in TRC logs
+            self.update_fw_info({})
+            self._clear_reset_fields(self.vcu_reset)
+            self._clear_reset_fields(self.bms_reset)
+            self.restore_browse_button()
 
     def _start_fw_scan(self, path: str):
-        thread = FWCheckerThread(path)
-        self.fw_thread = thread
+        task = FWCheckerTask(path)
+        # Keep the signals alive; the pool deletes the runnable once it has run
+        self.fw_signals = task.signals
         self._register_scan_task()
-        thread.finished_ok.connect(self.update_fw_info)
-        thread.finished_err.connect(self.on_fw_error)
-        thread.finished.connect(self._on_scan_finished)
-        thread.start()
-
-    def _start_vcu_reset_check(self, path: str, track_scan: bool):
-        if not os.path.exists(self.vcu_reset_script):
-            self.reset_vcu_fields()
-            QMessageBox.warning(self, "Error", f"VCU reset script not found:\n{self.vcu_reset_script}")
+        task.signals.finished_ok.connect(self.update_fw_info)
+        task.signals.finished_err.connect(self.on_fw_error)
+        task.signals.finished.connect(self._on_scan_finished)
+        self.scan_pool.start(task)
+
+    def _start_reset_script(self, label: str, trc_file: str, script_path: str, output_path: str,
+                            on_ok, on_err, on_done) -> QProcess:
+        """
+        Run a reset-count script without blocking the GUI and pass the JSON it
+        writes to on_ok (or an error message to on_err); on_done always runs last.
+        """
+        proc = QProcess(self)
+        proc.setWorkingDirectory(os.path.dirname(script_path))
+
+        def finished(exit_code, exit_status):
+            if exit_status != QProcess.NormalExit or exit_code != 0:
+                err = bytes(proc.readAllStandardError()).decode(errors="ignore")
+                out = bytes(proc.readAllStandardOutput()).decode(errors="ignore")
+                on_err(err or out or f"{label} reset script failed")
+            else:
+                try:
+                    data = _read_json(output_path, encoding="utf-8", errors="ignore")
+                except Exception as e:
+                    on_err(str(e))
+                else:
+                    on_ok(data)
+            on_done()
+            proc.deleteLater()
+
+        def error(err):
+            # Every other error is followed by finished()
+            if err == QProcess.FailedToStart:
+                on_err(proc.errorString())
+                on_done()
+                proc.deleteLater()
+
+        proc.finished.connect(finished)
+        proc.errorOccurred.connect(error)
+        proc.start(sys.executable, [script_path, trc_file, output_path])
+        return proc
+
+    def _reset_script_exists(self, script_path: str) -> bool:
+        # A script deleted after it was found shows up as a failed run in _start_reset_script
+        if script_path not in self.reset_scripts_found:
+            if not os.path.exists(script_path):
+                return False
+            self.reset_scripts_found.add(script_path)
+        return True
+
+    def _start_reset_check(self, section: ResetSection, path: str, track_scan: bool):
+        if not self._reset_script_exists(section.script):
+            self._clear_reset_fields(section)
+            QMessageBox.warning(self, "Error", f"{section.label} reset script not found:\n{section.script}")
             return
 
-        self.btn_vcu.setEnabled(False)
-        self.tx_vcu_value.setText("Count : ...")
-        self.tx_vcu_result.setText("...")
-        self._style_vcu_fields(None)
+        section.button.setEnabled(False)
+        section.value_field.setText("Count : ...")
+        section.result_field.setText("...")
+        self._style_result_fields(section, None)
 
-        thread = VCUResetThread(path, self.vcu_reset_script, self.vcu_reset_output)
         if track_scan:
             self._register_scan_task()
-        thread.finished_ok.connect(self.update_vcu_reset_fields)
-        thread.finished_err.connect(self.on_vcu_reset_error)
-        thread.finished.connect(lambda: self._on_vcu_reset_finished(track_scan))
-        thread.start()
-        self.vcu_thread = thread
+        self.reset_procs[section.label] = self._start_reset_script(
+            section.label, path, section.script, section.output,
+            lambda data: self._update_reset_fields(section, data),
+            lambda msg: self._on_reset_error(section, msg),
+            lambda: self._on_reset_finished(section, track_scan),
+        )
 
-    def _on_vcu_reset_finished(self, track_scan: bool):
-        self.btn_vcu.setEnabled(False)
+    def _on_reset_finished(self, section: ResetSection, track_scan: bool):
+        section.button.setEnabled(False)
         if track_scan:
             self._on_scan_finished()
 
@@ -870,39 +1112,17 @@ class CANLogDebugger(QWidget):
         if not path:
             if manual:
                 QMessageBox.warning(self, "Error", "No file loaded!")
-            self.reset_bms_fields()
-            return
-
-        if not os.path.exists(self.bms_reset_script):
-            self.reset_bms_fields()
-            QMessageBox.warning(self, "Error", f"BMS reset script not found:\n{self.bms_reset_script}")
+            self._clear_reset_fields(self.bms_reset)
             return
 
         ext = os.path.splitext(path)[1].lower()
         if ext != ".trc":
-            self.reset_bms_fields()
+            self._clear_reset_fields(self.bms_reset)
             if manual:
                 QMessageBox.warning(self, "Error", "BMS reset check only runs on .trc files.")
             return
 
-        self.btn_bms.setEnabled(False)
-        self.tx_bms_value.setText("Count : ...")
-        self.tx_bms_result.setText("...")
-        self._style_bms_fields(None)
-
-        thread = BMSResetThread(path, self.bms_reset_script, self.bms_reset_output)
-        if track_scan:
-            self._register_scan_task()
-        thread.finished_ok.connect(self.update_bms_reset_fields)
-        thread.finished_err.connect(self.on_bms_reset_error)
-        thread.finished.connect(lambda: self._on_bms_reset_finished(track_scan))
-        thread.start()
-        self.bms_thread = thread
-
-    def _on_bms_reset_finished(self, track_scan: bool):
-        self.btn_bms.setEnabled(False)
-        if track_scan:
-            self._on_scan_finished()
+        self._start_reset_check(self.bms_reset, path, track_scan)
 
     def restore_browse_button(self):
         if getattr(self, "scan_tasks", 0) > 0:
@@ -932,106 +1152,36 @@ class CANLogDebugger(QWidget):
         dist_val = info.get("DISTANCE_COVERED_KM", info.get("DISTANCE_COVERED", ""))
         self.tx_distance.setText(_fmt_dist(dist_val))
 
-    def update_vcu_reset_fields(self, data: dict):
+    def _update_reset_fields(self, section: ResetSection, data: dict):
         count = data.get("Reset_Count", 0)
         result_raw = str(data.get("Result", "")).strip().upper()
         result = result_raw or ("PASS" if count == 0 else "FAIL")
-        tooltip = f"Read from {self.vcu_reset_output}"
-        self.tx_vcu_value.setToolTip(tooltip)
-        self.tx_vcu_result.setToolTip(tooltip)
-        self.tx_vcu_value.setText(f"Count : {count}")
-        self.tx_vcu_result.setText(result)
-        self.tx_vcu_value.setAlignment(Qt.AlignCenter)
-        self.tx_vcu_result.setAlignment(Qt.AlignCenter)
-        self._style_vcu_fields(result)
-
-    def on_vcu_reset_error(self, msg: str):
-        self.reset_vcu_fields()
-        QMessageBox.warning(self, "VCU Reset Error", msg)
-
-    def update_bms_reset_fields(self, data: dict):
-        count = data.get("Reset_Count", 0)
-        result_raw = str(data.get("Result", "")).strip().upper()
-        result = result_raw or ("PASS" if count == 0 else "FAIL")
-        tooltip = f"Read from {self.bms_reset_output}"
-        self.tx_bms_value.setToolTip(tooltip)
-        self.tx_bms_result.setToolTip(tooltip)
-        self.tx_bms_value.setText(f"Count : {count}")
-        self.tx_bms_result.setText(result)
-        self.tx_bms_value.setAlignment(Qt.AlignCenter)
-        self.tx_bms_result.setAlignment(Qt.AlignCenter)
-        self._style_bms_fields(result)
-
-    def on_bms_reset_error(self, msg: str):
-        self.reset_bms_fields()
-        QMessageBox.warning(self, "BMS Reset Error", msg)
-
-    def reset_vcu_fields(self):
-        self.tx_vcu_value.setText("Count : N/A")
-        self.tx_vcu_result.setText("N/A")
-        self.tx_vcu_value.setToolTip("")
-        self.tx_vcu_result.setToolTip("")
-        self.tx_vcu_value.setAlignment(Qt.AlignCenter)
-        self.tx_vcu_result.setAlignment(Qt.AlignCenter)
-        self._style_vcu_fields(None)
-
-    def reset_bms_fields(self):
-        self.tx_bms_value.setText("Count : N/A")
-        self.tx_bms_result.setText("N/A")
-        self.tx_bms_value.setToolTip("")
-        self.tx_bms_result.setToolTip("")
-        self.tx_bms_value.setAlignment(Qt.AlignCenter)
-        self.tx_bms_result.setAlignment(Qt.AlignCenter)
-        self._style_bms_fields(None)
-
-    def _style_vcu_fields(self, result: Optional[str]):
-        def apply_style(widget: QLineEdit, default_palette: QPalette, bg: str, fg: str):
-            if not bg:
-                widget.setPalette(default_palette)
-                widget.setStyleSheet("")
-                widget.setAlignment(Qt.AlignCenter)
-                return
-            pal = QPalette(default_palette)
-            pal.setColor(QPalette.Base, QColor(bg))
-            pal.setColor(QPalette.Text, QColor(fg))
-            widget.setPalette(pal)
-            widget.setStyleSheet(f"QLineEdit {{ background:{bg}; color:{fg}; font-weight:bold; }}")
-            widget.setAlignment(Qt.AlignCenter)
-
-        if result == "PASS":
-            bg, fg = "#28A745", "white"
-        elif result == "FAIL":
-            bg, fg = "#FF0000", "white"
-        else:
-            bg, fg = "", ""
-
-        apply_style(self.tx_vcu_value, self.vcu_value_palette_default, bg, fg)
-        apply_style(self.tx_vcu_result, self.vcu_result_palette_default, bg, fg)
-
-    def _style_bms_fields(self, result: Optional[str]):
-        def apply_style(widget: QLineEdit, default_palette: QPalette, bg: str, fg: str):
-            if not bg:
-                widget.setPalette(default_palette)
-                widget.setStyleSheet("")
-                widget.setAlignment(Qt.AlignCenter)
-                return
-            pal = QPalette(default_palette)
-            pal.setColor(QPalette.Base, QColor(bg))
-            pal.setColor(QPalette.Text, QColor(fg))
-            widget.setPalette(pal)
-            widget.setStyleSheet(f"QLineEdit {{ background:{bg}; color:{fg}; font-weight:bold; }}")
+        tooltip = f"Read from {section.output}"
+        section.value_field.setToolTip(tooltip)
+        section.result_field.setToolTip(tooltip)
+        section.value_field.setText(f"Count : {count}")
+        section.result_field.setText(result)
+        self._style_result_fields(section, result)
+
+    def _on_reset_error(self, section: ResetSection, msg: str):
+        self._clear_reset_fields(section)
+        QMessageBox.warning(self, f"{section.label} Reset Error", msg)
+
+    def _clear_reset_fields(self, section: ResetSection):
+        section.value_field.setText("Count : N/A")
+        section.result_field.setText("N/A")
+        section.value_field.setToolTip("")
+        section.result_field.setToolTip("")
+        self._style_result_fields(section, None)
+
+    def _style_result_fields(self, section: ResetSection, result: Optional[str]):
+        css = RESULT_FIELD_STYLES.get(result, "")
+        for widget in (section.value_field, section.result_field):
+            palettes = self.result_field_palettes[widget]
+            widget.setPalette(palettes[result] if css else palettes[None])
+            widget.setStyleSheet(css)
             widget.setAlignment(Qt.AlignCenter)
 
-        if result == "PASS":
-            bg, fg = "#28A745", "white"
-        elif result == "FAIL":
-            bg, fg = "#FF0000", "white"
-        else:
-            bg, fg = "", ""
-
-        apply_style(self.tx_bms_value, self.bms_value_palette_default, bg, fg)
-        apply_style(self.tx_bms_result, self.bms_result_palette_default, bg, fg)
-
     def on_fw_error(self, err):
         QMessageBox.warning(self, "FW Error", err)
 
@@ -1053,51 +1203,79 @@ class CANLogDebugger(QWidget):
         self._update_title_glow()  # kick off glow immediately
 
         self.pending_result_rows.clear()
+        self.result_deadlines.clear()
+        self.result_wait_timer.stop()
         self._ensure_result_timer_running()
 
-        # Reset status and result columns
-        for i in range(len(TEST_CASES)):
-            status_item = QTableWidgetItem("Not Run")
-            status_item.setTextAlignment(Qt.AlignCenter)
-            self.test_table.setItem(i, 1, status_item)
-            result_item = QTableWidgetItem("N/A")
-            result_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            self.test_table.setItem(i, 4, result_item)
-
         self.processes.clear()
-        python = sys.executable
+        self.queued_rows.clear()
         self.running_rows.clear()
 
-        for row, script in SCRIPT_BY_ROW.items():
-            folder_path, script_path = self._get_test_script_paths(row)
+        # Repaint the table once after every row has been reset and queued
+        self.test_table.setUpdatesEnabled(False)
+        try:
+            # Reset status and result columns
+            for i in range(len(TEST_CASES)):
+                status_item = QTableWidgetItem("Not Run")
+                status_item.setTextAlignment(Qt.AlignCenter)
+                self.test_table.setItem(i, 1, status_item)
+                result_item = QTableWidgetItem("N/A")
+                result_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+                self.test_table.setItem(i, 4, result_item)
+
+            for row in range(len(TEST_ROWS)):
+                folder_path, script_path = self._get_test_script_paths(row)
+
+                if not folder_path or not os.path.exists(script_path):
+                    # Missing script/folder
+                    self._set_colored_cell(row, 1, "Missing/Incorrect", "#FF0000")
+                    continue
+
+                status_item = QTableWidgetItem("Queued")
+                status_item.setTextAlignment(Qt.AlignCenter)
+                self.test_table.setItem(row, 1, status_item)
+                self.queued_rows.append(row)
+        finally:
+            self.test_table.setUpdatesEnabled(True)
+
+        # Edge case: if nothing to run, reset button immediately
+        if not self.queued_rows:
+            self.run_all_btn.setEnabled(True)
+            self.run_all_btn.setText("RUN ALL TEST CASES")
+            self.run_all_btn.setStyleSheet("background:#28A745; color:white; font-weight:bold;")
+            self.run_all_animating = False
+            return
 
-            if not folder_path or not os.path.exists(script_path):
-                # Missing script/folder
-                self._set_colored_cell(row, 1, "Missing/Incorrect", "#FF0000")
-                continue
+        self._start_queued_tests()
+
+    def _start_queued_tests(self):
+        """Start queued rows until MAX_CONCURRENT_TESTS scripts are running."""
+        running = sum(p.state() != QProcess.NotRunning for p in self.processes.values())
+        while self.queued_rows and running < MAX_CONCURRENT_TESTS:
+            row = self.queued_rows.popleft()
+            folder_path, script_path = self._get_test_script_paths(row)
 
             self.pending_result_rows.add(row)
             self._ensure_result_timer_running()
+            self._watch_result_row(row)
 
             # Mark as running
             self._mark_row_running(row)
 
             proc = QProcess(self)
             proc.setWorkingDirectory(folder_path)
+            proc.setProcessEnvironment(self.test_env)
+            # Console output goes straight to <test>_run.log instead of piling up in QProcess buffers
+            proc.setProcessChannelMode(QProcess.MergedChannels)
+            proc.setStandardOutputFile(os.path.join(folder_path, f"{TEST_ROWS[row].folder}_run.log"))
 
             # Capture row in lambda default
             proc.finished.connect(lambda exitCode, _status, r=row: self.on_test_finished(r, exitCode))
             proc.errorOccurred.connect(lambda _e, r=row: self.on_test_error(r))
 
-            proc.start(python, [script, self.selected_file_path])
             self.processes[row] = proc
-
-        # Edge case: if nothing started, reset button immediately
-        if not self.processes:
-            self.run_all_btn.setEnabled(True)
-            self.run_all_btn.setText("RUN ALL TEST CASES")
-            self.run_all_btn.setStyleSheet("background:#28A745; color:white; font-weight:bold;")
-            self.run_all_animating = False
+            proc.start(sys.executable, [TEST_ROWS[row].script, self.selected_file_path])
+            running += 1
 
     def on_test_finished(self, row, exitCode):
         self.running_rows.discard(row)
@@ -1113,11 +1291,13 @@ class CANLogDebugger(QWidget):
             if not self.update_result_cell(row):
                 self._schedule_result_update(row)
 
+        self._start_queued_tests()
         self._maybe_finish_run_all()
 
-    def on_test_error(self, row, _):
+    def on_test_error(self, row, _=None):
         self.running_rows.discard(row)
         self._set_colored_cell(row, 1, "Missing/Incorrect", "#FF0000")
+        self._start_queued_tests()
         self._maybe_finish_run_all()
 
     def _mark_result_missing(self, row: int, reason: Optional[str] = None):
@@ -1134,9 +1314,7 @@ class CANLogDebugger(QWidget):
         item = QTableWidgetItem("N/A")
         item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         item.setToolTip(reason)
-        font = item.font()
-        font.setBold(True)
-        item.setFont(font)
+        item.setFont(self.bold_font)
         self.test_table.setItem(row, 4, item)
         if row in self.pending_result_rows:
             self.pending_result_rows.discard(row)
@@ -1148,12 +1326,9 @@ class CANLogDebugger(QWidget):
         if not results_path:
             return False
 
-        if not os.path.exists(results_path):
-            return False
-
+        # A missing or half-written JSON just fails to open/parse; no separate exists() stat
         try:
-            with open(results_path, "r") as f:
-                data = json.load(f)
+            data = _read_json(results_path)
             result_str = str(data.get("Result", "")).strip().upper()
         except Exception:
             return False
@@ -1177,31 +1352,33 @@ class CANLogDebugger(QWidget):
             if current_status != "completed":
                 self._set_colored_cell(row, 1, "Completed", "#28A745")
 
+            self.result_deadlines.pop(row, None)
             if row in self.pending_result_rows:
                 self.pending_result_rows.discard(row)
                 self._ensure_result_timer_running()
             self._maybe_finish_run_all()
         return success
 
-    def _schedule_result_update(
-        self, row: int, attempts: int = RESULT_POLL_ATTEMPTS, delay_ms: int = RESULT_POLL_DELAY_MS
-    ):
-        """Retry updating result after giving scripts time to write output."""
-        if attempts <= 0:
-            self._mark_result_missing(row)
-            return
-        QTimer.singleShot(
-            delay_ms,
-            lambda r=row, a=attempts - 1, d=delay_ms: self._retry_result_update(r, a, d),
-        )
+    def _schedule_result_update(self, row: int):
+        """Give the script time to write its output; the result watcher picks it up meanwhile."""
+        self.result_deadlines[row] = time.monotonic() + RESULT_POLL_ATTEMPTS * RESULT_POLL_DELAY_MS / 1000
+        self._arm_result_wait_timer()
 
-    def _retry_result_update(self, row: int, attempts: int, delay_ms: int):
-        if self.update_result_cell(row):
+    def _arm_result_wait_timer(self):
+        if not self.result_deadlines:
+            self.result_wait_timer.stop()
             return
-        if attempts <= 0:
-            self._mark_result_missing(row)
-        else:
-            self._schedule_result_update(row, attempts, delay_ms)
+        remaining = min(self.result_deadlines.values()) - time.monotonic()
+        self.result_wait_timer.start(max(0, math.ceil(remaining * 1000)))
+
+    def _expire_result_waits(self):
+        """Mark rows whose deadline has passed as missing, then wait for the next deadline."""
+        now = time.monotonic()
+        for row, deadline in list(self.result_deadlines.items()):
+            if deadline <= now and self.result_deadlines.pop(row, None) is not None:
+                # Does one final read before giving up
+                self._mark_result_missing(row)
+        self._arm_result_wait_timer()
 
     # ======================================================
     # VIEW RESULT / GRAPH
@@ -1247,24 +1424,6 @@ class CANLogDebugger(QWidget):
     # ======================================================
     # RESET CHECKERS
     # ======================================================
-    def _count_keyword(self, keywords):
-        if not self.selected_file_path:
-            QMessageBox.warning(self, "Error", "No file loaded!")
-            return 0
-
-        total = 0
-        try:
-            with open(self.selected_file_path, "r", errors="ignore") as f:
-                for line in f:
-                    l = line.lower()
-                    for k in keywords:
-                        if k in l:
-                            total += 1
-                            break
-        except Exception:
-            pass
-        return total
-
     def check_vcu(self):
         if not self.selected_file_path:
             QMessageBox.warning(self, "Error", "No file loaded!")
@@ -1272,9 +1431,9 @@ class CANLogDebugger(QWidget):
         file_ext = os.path.splitext(self.selected_file_path)[1].lower()
         if file_ext != ".trc":
             QMessageBox.warning(self, "Error", "VCU reset check only runs on .trc files.")
-            self.reset_vcu_fields()
+            self._clear_reset_fields(self.vcu_reset)
             return
-        self._start_vcu_reset_check(self.selected_file_path, track_scan=False)
+        self._start_reset_check(self.vcu_reset, self.selected_file_path, track_scan=False)
 
     def check_bms(self):
         self._run_bms_reset_check(manual=True)
@@ -1292,24 +1451,28 @@ class CANLogDebugger(QWidget):
 
         out_file = "tracker_summary.csv"
 
+        # Snapshot the fields on the GUI thread; the write is then a single call
+        rows = [
+            ["Field", "Value"],
+            ["BMS HW VERSION", self.tx_hw.text()],
+            ["BMS FIRMWARE", self.tx_fw.text()],
+            ["BMS CONFIG ID", self.tx_cfg.text()],
+            ["BMS GITSHA", self.tx_git.text()],
+            ["BMS MANIFEST", self.tx_manifest.text()],
+            ["STARK FIRMWARE", self.tx_stark_fw.text()],
+            ["STARK CONFIG", self.tx_stark_cfg.text()],
+            ["XAVIER FIRMWARE", self.tx_xavier_fw.text()],
+            ["Distance Covered", self.tx_distance.text()],
+
+            ["VCU Reset Count", self.tx_vcu_value.text()],
+            ["VCU Reset Result", self.tx_vcu_result.text()],
+            ["BMS Reset Count", self.tx_bms_value.text()],
+            ["BMS Reset Result", self.tx_bms_result.text()],
+        ]
+
         try:
             with open(out_file, "w", newline="") as fw:
-                writer = csv.writer(fw)
-                writer.writerow(["Field", "Value"])
-                writer.writerow(["BMS HW VERSION", self.tx_hw.text()])
-                writer.writerow(["BMS FIRMWARE", self.tx_fw.text()])
-                writer.writerow(["BMS CONFIG ID", self.tx_cfg.text()])
-                writer.writerow(["BMS GITSHA", self.tx_git.text()])
-                writer.writerow(["BMS MANIFEST", self.tx_manifest.text()])
-                writer.writerow(["STARK FIRMWARE", self.tx_stark_fw.text()])
-                writer.writerow(["STARK CONFIG", self.tx_stark_cfg.text()])
-                writer.writerow(["XAVIER FIRMWARE", self.tx_xavier_fw.text()])
-                writer.writerow(["Distance Covered", self.tx_distance.text()])
-
-                writer.writerow(["VCU Reset Count", self.tx_vcu_value.text()])
-                writer.writerow(["VCU Reset Result", self.tx_vcu_result.text()])
-                writer.writerow(["BMS Reset Count", self.tx_bms_value.text()])
-                writer.writerow(["BMS Reset Result", self.tx_bms_result.text()])
+                csv.writer(fw).writerows(rows)
 
             QMessageBox.information(self, "Tracker", f"Tracker generated: {out_file}")
 
@@ -1332,6 +1495,9 @@ def run_updater_first(app: QApplication):
     check_for_update(local_version=local_version, app=app)
 
 def main():
+    # Registered here, not at import, so no re-import of this module (e.g. a
+    # spawned child process) rewrites the cache with a stale snapshot on exit
+    atexit.register(_save_fw_cache)
     app = QApplication(sys.argv)
     run_updater_first(app)
     w = CANLogDebugger()
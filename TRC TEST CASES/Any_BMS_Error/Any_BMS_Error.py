@@ -2,19 +2,29 @@ import os
 import sys
 import json
 import re
-from datetime import datetime
-import matplotlib.pyplot as plt
-
-# -----------------------------------------------------
-# TRC regex (same style as other scripts)
-# -----------------------------------------------------
-pattern = re.compile(
-    r"\s*\d+\)\s+(\d{2}-\d{2}-\d{4})\s+"
-    r"(\d{2}:\d{2}:\d{2})\.(\d{3,4})(?:\.\d+)?\s+\w+\s+"
-    r"([0-9A-Fa-f]+)\s+(\d+)\s+(.*)"
-)
-
-OUTPUT_ENCODING = "cp1252"  # for JSON (Windows-friendly)
+import mmap
+from collections import deque, namedtuple
+from contextlib import nullcontext
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+
+def dump_json(obj, path):
+    """
+    Write obj as JSON to path, via orjson when it is installed. Both paths
+    write the same 2-space indented UTF-8 (our output is plain ASCII, so that
+    is also valid cp1252).
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
 
 # -----------------------------------------------------
 # Error signal mapping (CAN-level)
@@ -63,12 +73,44 @@ ERROR_SIGNALS = {
     "Isolation_Failure":         {"can_id": 0x0260, "type": "bit", "byte": 3, "bit": 2},
 }
 
-INTERESTING_CAN_IDS = set(v["can_id"] for v in ERROR_SIGNALS.values())
+# CAN ID -> (signal names, data byte per signal, mask per signal) as parallel arrays,
+# mask 0xFF for byte-type signals, so all frames of one ID decode in one NumPy op
+SIGNAL_COLUMNS = {}
+for _can_id in dict.fromkeys(d["can_id"] for d in ERROR_SIGNALS.values()):
+    _signals = [(n, d) for n, d in ERROR_SIGNALS.items() if d["can_id"] == _can_id]
+    SIGNAL_COLUMNS[_can_id] = (
+        [n for n, _ in _signals],
+        np.array([d["byte"] for _, d in _signals], dtype=np.intp),
+        np.array([1 << d["bit"] if d["type"] == "bit" else 0xFF for _, d in _signals], dtype=np.uint8),
+    )
+
+# First UV/OV instance carries the voltage/SoC context
+UV_DEFN = ERROR_SIGNALS["UV_ERROR"]
+OV_DEFN = ERROR_SIGNALS["OV_ERROR"]
 
 # Additional CAN frames for UV diagnostic context
 DG_VOLTAGE_CAN_ID = 0x012C  # DG_voltageData
 AA_BATT_PARAM_2_CAN_ID = 0x0109  # AA_Batt_Param_2
 
+# -----------------------------------------------------
+# TRC regex (same style as other scripts), run over the mapped file as raw bytes.
+# It only matches frames of the CAN IDs decoded here, so every other line is
+# skipped inside the regex engine; [^\S\n] keeps a match within one line.
+# -----------------------------------------------------
+def hex_id_regex(can_id):
+    """A CAN ID as a TRC hex field: any case, any number of leading zeros."""
+    return "0*" + "".join(f"[{c}{c.lower()}]" if c.isalpha() else c for c in f"{can_id:X}")
+
+DECODED_CAN_IDS = sorted({*SIGNAL_COLUMNS, DG_VOLTAGE_CAN_ID, AA_BATT_PARAM_2_CAN_ID})
+
+pattern = re.compile(
+    rb"^[^\S\n]*\d+\)[^\S\n]+(\d{2}-\d{2}-\d{4})[^\S\n]+"
+    rb"(\d{2}:\d{2}:\d{2})\.(\d{3,4})(?:\.\d+)?[^\S\n]+\w+[^\S\n]+"
+    rb"(" + "|".join(map(hex_id_regex, DECODED_CAN_IDS)).encode("ascii") + rb")"
+    rb"[^\S\n]+(\d+)(?:[^\S\n]+|(?=\n))(.*)",
+    re.MULTILINE,
+)
+
 # Display order for table (matches your sheet first, then the rest)
 DISPLAY_ORDER = [
     "SCD_ERROR",
@@ -109,22 +151,34 @@ DISPLAY_ORDER = [
 # -----------------------------------------------------
 # Helpers
 # -----------------------------------------------------
-def get_signal_value(defn, data, dlc):
+def is_bit_set(defn, data, dlc):
     b = defn["byte"]
-    if b >= dlc:
-        return 0
-    if defn["type"] == "bit":
-        bit = defn["bit"]
-        return (data[b] >> bit) & 0x01
-    elif defn["type"] == "byte":
-        return data[b]
-    return 0
+    return b < dlc and (data[b] >> defn["bit"]) & 0x01 == 1
 
 def get_line_count(s):
     if not s:
         return 1
     return s.count("\n") + 1
 
+# PNG table geometry, in pixels (9 pt text at 220 dpi)
+TABLE_FONT_PX = 28
+TABLE_PAD_PX = 12
+TABLE_LINE_GAP_PX = 6
+TABLE_MARGIN_PX = 22
+
+def load_table_font(bold=False):
+    """Arial on Windows, DejaVu Sans elsewhere, Pillow's built-in font as a last resort."""
+    names = ("arialbd.ttf", "DejaVuSans-Bold.ttf") if bold else ("arial.ttf", "DejaVuSans.ttf")
+    for name in names:
+        try:
+            return ImageFont.truetype(name, TABLE_FONT_PX)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(TABLE_FONT_PX)
+    except TypeError:  # Pillow < 10.1 has no sized default font
+        return ImageFont.load_default()
+
 def parse_le_unsigned(data, start_bit, length):
     """
     Basic little-endian extraction for byte-aligned signals.
@@ -134,10 +188,7 @@ def parse_le_unsigned(data, start_bit, length):
     byte_len = (length + 7) // 8
     if len(data) < byte_index + byte_len:
         return None
-    value = 0
-    for i in range(byte_len):
-        value |= data[byte_index + i] << (8 * i)
-    return value
+    return int.from_bytes(data[byte_index:byte_index + byte_len], "little")
 
 def format_number(value, decimals):
     if value is None:
@@ -175,19 +226,24 @@ print(f"Using TRC file: {trc_path}")
 # We track instances as continuous stretches of "active"
 error_states = {
     name: {
-        "last_active": False,
         "instances": [],        # list of {Start_Timestamp, End_Timestamp, Active_Frames}
-        "last_value": 0,
         "last_nonzero": None    # for byte-type signals
     }
     for name in ERROR_SIGNALS.keys()
 }
 
-first_ts_ms = None
-last_v_samples = []  # capped FIFO with latest voltage/SoC samples
+# Raw frames of the error CAN IDs, decoded after parsing: timestamps plus data
+# bytes padded/truncated to 8 per frame
+error_frame_ts = {can_id: [] for can_id in SIGNAL_COLUMNS}
+error_frame_data = {can_id: bytearray() for can_id in SIGNAL_COLUMNS}
+
+VSample = namedtuple("VSample", "Vmin Vmax SoC Timestamp")  # Vmin/Vmax in mV, SoC in %
+last_v_samples = deque(maxlen=20)  # capped FIFO with latest voltage/SoC samples
 latest_soc = None
 uv_context_added = False  # ensure UV context only on first UV instance
 ov_context_added = False  # ensure OV context only on first OV instance
+uv_ctx = None
+ov_ctx = None
 
 def update_voltage_samples(can_id, data, dlc, ts_string):
     global latest_soc
@@ -200,141 +256,117 @@ def update_voltage_samples(can_id, data, dlc, ts_string):
         raw_vmin = parse_le_unsigned(data, 16, 16)
         if raw_vmax is None or raw_vmin is None:
             return
-        v_max = raw_vmax * 0.1
-        v_min = raw_vmin * 0.1
-        sample = {
-            "Vmin": v_min,
-            "Vmax": v_max,
-            "SoC": latest_soc,
-            "Timestamp": ts_string
-        }
-        last_v_samples.append(sample)
-        if len(last_v_samples) > 20:
-            last_v_samples.pop(0)
+        last_v_samples.append(VSample(raw_vmin * 0.1, raw_vmax * 0.1, latest_soc, ts_string))
+
+def sample_context(s):
+    return {
+        "Selected_Vmin": s.Vmin,
+        "Selected_Vmax": s.Vmax,
+        "Selected_SoC": s.SoC,
+        "Context_Timestamp": s.Timestamp
+    }
 
 def compute_uv_context():
-    recent = last_v_samples[-5:]
-    valid = []
-    for s in recent:
-        if s is None:
-            continue
-        vmin = s.get("Vmin")
-        if vmin is None:
-            continue
-        if 200 <= vmin <= 6500:
-            valid.append(s)
+    recent = list(last_v_samples)[-5:]
+    valid = [s for s in recent if 200 <= s.Vmin <= 6500]
     if not valid:
         return None
-    selected = min(valid, key=lambda s: s["Vmin"])
-    return {
-        "Selected_Vmin": selected.get("Vmin"),
-        "Selected_Vmax": selected.get("Vmax"),
-        "Selected_SoC": selected.get("SoC"),
-        "Context_Timestamp": selected.get("Timestamp")
-    }
+    return sample_context(min(valid, key=lambda s: s.Vmin))
 
 def compute_ov_context():
-    recent = last_v_samples[-5:]
-    valid = []
-    for s in recent:
-        if s is None:
-            continue
-        vmin = s.get("Vmin")
-        vmax = s.get("Vmax")
-        if vmin is None or vmax is None:
-            continue
-        if 200 <= vmin <= 6500 and 200 <= vmax <= 6500:
-            valid.append(s)
+    recent = list(last_v_samples)[-5:]
+    valid = [s for s in recent if 200 <= s.Vmin <= 6500 and 200 <= s.Vmax <= 6500]
     if not valid:
         return None
-    selected = max(valid, key=lambda s: s["Vmax"])
-    return {
-        "Selected_Vmin": selected.get("Vmin"),
-        "Selected_Vmax": selected.get("Vmax"),
-        "Selected_SoC": selected.get("SoC"),
-        "Context_Timestamp": selected.get("Timestamp")
-    }
+    return sample_context(max(valid, key=lambda s: s.Vmax))
 
 # -----------------------------------------------------
 # PARSE TRC
 # -----------------------------------------------------
-with open(trc_path, "r", encoding="utf-8", errors="ignore") as f:
-    for line in f:
-        m = pattern.match(line)
-        if not m:
-            continue
-
-        date_str = m.group(1)
-        time_str = m.group(2)
-        ms_str   = m.group(3)
+# Bound once; these run for every matched frame
+fromhex = bytes.fromhex
+frame_ts_for = error_frame_ts.get
+
+with open(trc_path, "rb") as f, (
+    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if os.fstat(f.fileno()).st_size else nullcontext(b"")  # empty files cannot be mapped
+) as trc_buf:
+    for m in pattern.finditer(trc_buf):
+        date_raw, time_raw, ms_raw, id_raw, dlc_raw, data_raw = m.groups()
+        date_str = date_raw.decode("ascii")
+        time_str = time_raw.decode("ascii")
+        ms_str   = ms_raw.decode("ascii")
         ms_norm = ms_str if len(ms_str) == 4 else ms_str + "0" if len(ms_str) == 3 else ms_str
-        can_id   = int(m.group(4), 16)
-        dlc      = int(m.group(5))
-        data_str = m.group(6).strip()
-        bytes_hex = data_str.split()
+        can_id   = int(id_raw, 16)
+        # One lookup decides the frame's role: error frames get a timestamp list,
+        # the rest are voltage/SoC frames, only needed until both UV/OV contexts are taken
+        frame_ts = frame_ts_for(can_id)
+        if frame_ts is None and uv_context_added and ov_context_added:
+            continue
+        dlc      = int(dlc_raw)
+        bytes_hex = data_raw.split()
 
         if len(bytes_hex) < dlc:
             continue
 
-        data = [int(b, 16) for b in bytes_hex[:dlc]]
+        try:
+            data = fromhex(b" ".join(bytes_hex[:dlc]).decode("ascii"))
+        except ValueError:
+            continue  # not a list of two-digit hex bytes
 
         ts_string = f"{date_str} {time_str}.{ms_norm}"   # preserve exact TRC-style format
-        dt = datetime.strptime(ts_string, "%d-%m-%Y %H:%M:%S.%f")
-        ts_ms = dt.timestamp() * 1000.0
-
-        if first_ts_ms is None:
-            first_ts_ms = ts_ms
+        if frame_ts is None:
+            # Update rolling voltage/SoC samples (independent of error parsing)
+            update_voltage_samples(can_id, data, dlc, ts_string)
+            continue
 
-        # Update rolling voltage/SoC samples (independent of error parsing)
-        update_voltage_samples(can_id, data, dlc, ts_string)
+        frame_ts.append(ts_string)
+        error_frame_data[can_id] += data[:8].ljust(8, b"\x00")
 
-        if can_id not in INTERESTING_CAN_IDS:
-            continue
+        # The first UV/OV instance starts at the first frame with its bit set; grab the
+        # voltage/SoC context seen up to that frame
+        if not uv_context_added and can_id == UV_DEFN["can_id"] and is_bit_set(UV_DEFN, data, dlc):
+            uv_ctx = compute_uv_context()
+            uv_context_added = True
+        if not ov_context_added and can_id == OV_DEFN["can_id"] and is_bit_set(OV_DEFN, data, dlc):
+            ov_ctx = compute_ov_context()
+            ov_context_added = True
 
-        # Process each signal belonging to this CAN ID
-        for name, defn in ERROR_SIGNALS.items():
-            if defn["can_id"] != can_id:
-                continue
-
-            val = get_signal_value(defn, data, dlc)
-            st = error_states[name]
-
-            st["last_value"] = val
-            if defn["type"] == "byte" and val > 0:
-                st["last_nonzero"] = val
-
-            # "Active" definition
-            if defn["type"] == "bit":
-                is_active = (val == 1)
-            else:  # byte
-                is_active = (val > 0)
-
-            if is_active:
-                if not st["last_active"]:
-                    # Start new instance
-                    new_instance = {
-                        "Start_Timestamp": ts_string,
-                        "End_Timestamp": ts_string,
-                        "Active_Frames": 1
-                    }
-                    if name == "UV_ERROR" and not uv_context_added:
-                        uv_ctx = compute_uv_context()
-                        if uv_ctx:
-                            new_instance["UV_Context"] = uv_ctx
-                        uv_context_added = True
-                    if name == "OV_ERROR" and not ov_context_added:
-                        ov_ctx = compute_ov_context()
-                        if ov_ctx:
-                            new_instance["OV_Context"] = ov_ctx
-                        ov_context_added = True
-                    st["instances"].append(new_instance)
-                else:
-                    # Extend last instance
-                    inst = st["instances"][-1]
-                    inst["End_Timestamp"] = ts_string
-                    inst["Active_Frames"] += 1
-
-            st["last_active"] = is_active
+# -----------------------------------------------------
+# DECODE ERROR SIGNALS
+# -----------------------------------------------------
+for can_id, (names, sig_bytes, sig_masks) in SIGNAL_COLUMNS.items():
+    timestamps = error_frame_ts[can_id]
+    if not timestamps:
+        continue
+
+    frames = np.frombuffer(error_frame_data[can_id], dtype=np.uint8).reshape(-1, 8)
+    values = frames[:, sig_bytes] & sig_masks  # one column per signal
+    # "Active" definition: bit set, or any non-zero byte.
+    # +1 where a stretch of active frames starts, -1 just past where it ends
+    edges = np.diff(values.astype(bool).astype(np.int8), axis=0, prepend=0, append=0)
+
+    for col, name in enumerate(names):
+        starts = np.flatnonzero(edges[:, col] == 1)
+        ends = np.flatnonzero(edges[:, col] == -1)
+        st = error_states[name]
+        st["instances"] = [
+            {
+                "Start_Timestamp": timestamps[start],
+                "End_Timestamp": timestamps[end - 1],
+                "Active_Frames": int(end - start)
+            }
+            for start, end in zip(starts, ends)
+        ]
+        if sig_masks[col] == 0xFF:
+            nonzero = np.flatnonzero(values[:, col])
+            if nonzero.size:
+                st["last_nonzero"] = int(values[nonzero[-1], col])
+
+if uv_ctx and error_states["UV_ERROR"]["instances"]:
+    error_states["UV_ERROR"]["instances"][0]["UV_Context"] = uv_ctx
+if ov_ctx and error_states["OV_ERROR"]["instances"]:
+    error_states["OV_ERROR"]["instances"][0]["OV_Context"] = ov_ctx
 
 # -----------------------------------------------------
 # BUILD RESULTS STRUCTURES
@@ -419,12 +451,11 @@ overall_result = "FAIL" if active_error_count > 0 else "PASS"
 # SAVE RESULTS JSON
 # -----------------------------------------------------
 results_path = os.path.join(folder, "Any_BMS_Error_results.json")
-with open(results_path, "w", encoding=OUTPUT_ENCODING) as f:
-    json.dump({
-        "Result": overall_result,
-        "Active_Error_Count": active_error_count,
-        "Signals": signals_result
-    }, f, indent=4, ensure_ascii=False)
+dump_json({
+    "Result": overall_result,
+    "Active_Error_Count": active_error_count,
+    "Signals": signals_result
+}, results_path)
 
 print(f"Saved: {results_path}")
 
@@ -463,8 +494,7 @@ for e in signals_result:
     lines.append(border)
 
 summary_path = os.path.join(folder, "Any_BMS_Error_summary.json")
-with open(summary_path, "w", encoding=OUTPUT_ENCODING) as f:
-    json.dump({"Summary_Table": lines}, f, indent=4, ensure_ascii=False)
+dump_json({"Summary_Table": lines}, summary_path)
 
 print(f"Saved: {summary_path}")
 
@@ -487,48 +517,60 @@ for e in signals_result:
     rows.append([name, status, inst_cnt, ts_text, val_text])
     line_counts.append(max(get_line_count(ts_text), get_line_count(val_text)))
 
-# Figure height scales with number of lines per row
-fig_width = 16
-fig_height = 2 + sum(0.35 * lc for lc in line_counts)
-
-fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-ax.axis("off")
-
-tbl = ax.table(
-    cellText=rows,
-    colLabels=headers,
-    loc="center",
-    cellLoc="left"
-)
-
-tbl.auto_set_font_size(False)
-tbl.set_fontsize(9)
-tbl.scale(1.0, 1.2)
-
-# Header styling
-for (r, c), cell in tbl.get_celld().items():
-    cell.set_edgecolor("black")
-    if r == 0:
-        cell.set_facecolor("#1FA37A")
-        cell.set_text_props(weight="bold", color="white")
-
-# Adjust row heights based on number of timestamp lines
-if rows:
-    base_height = tbl[1, 0].get_height()
-    for i, lc in enumerate(line_counts):
-        row_idx = i + 1  # +1 because row 0 is header
-        new_height = base_height * lc
-        for col in range(len(headers)):
-            tbl[row_idx, col].set_height(new_height)
-
-        # Optional: highlight rows with Status == YES
-        if rows[i][1] == "YES":
-            for col in range(len(headers)):
-                tbl[row_idx, col].set_facecolor("#FFCCCC")
+# Drawn straight onto a Pillow image: every cell is filled, outlined and
+# written once, sized to its text, with no figure/layout pass in between
+font = load_table_font()
+bold_font = load_table_font(bold=True)
+ascent, descent = font.getmetrics()
+line_h = ascent + descent + TABLE_LINE_GAP_PX
 
+table = [headers] + [[str(v) for v in row] for row in rows]
+row_heights = [lc * line_h + 2 * TABLE_PAD_PX for lc in [1] + line_counts]
+col_widths = [int(bold_font.getlength(h)) + 1 + 2 * TABLE_PAD_PX for h in headers]
 png_path = os.path.join(folder, "Any_BMS_Error_plot.png")
-plt.savefig(png_path, dpi=220, bbox_inches="tight")
-plt.close()
 
-print(f"Saved: {png_path}")
+# A log full of fail timestamps can ask for a table no viewer will open;
+# same pixel limit Pillow itself applies when opening images. Checked on
+# the header widths first so such a table is not measured line by line.
+min_pixels = (sum(col_widths) + 2 * TABLE_MARGIN_PX) * (sum(row_heights) + 2 * TABLE_MARGIN_PX)
+if min_pixels > Image.MAX_IMAGE_PIXELS:
+    print(f"Skipped: {png_path} (table too large, {sum(line_counts)} lines)")
+else:
+    for cells in table[1:]:
+        for c, text in enumerate(cells):
+            for text_line in text.split("\n"):
+                w = int(font.getlength(text_line)) + 1 + 2 * TABLE_PAD_PX
+                col_widths[c] = max(col_widths[c], w)
+
+    img_size = (sum(col_widths) + 2 * TABLE_MARGIN_PX + 1, sum(row_heights) + 2 * TABLE_MARGIN_PX + 1)
+    # Cell text can be far wider than its header, so check the final size too
+    if img_size[0] * img_size[1] > Image.MAX_IMAGE_PIXELS:
+        print(f"Skipped: {png_path} (table too large, {img_size[0]}x{img_size[1]} px)")
+    else:
+        img = Image.new("RGB", img_size, "white")
+        draw = ImageDraw.Draw(img)
+
+        y = TABLE_MARGIN_PX
+        for r, (cells, h) in enumerate(zip(table, row_heights)):
+            # Header styling; rows with Status == YES highlighted
+            if r == 0:
+                f, fill, color = bold_font, "#1FA37A", "white"
+            elif cells[1] == "YES":
+                f, fill, color = font, "#FFCCCC", "black"
+            else:
+                f, fill, color = font, "white", "black"
+
+            x = TABLE_MARGIN_PX
+            for text, w in zip(cells, col_widths):
+                draw.rectangle((x, y, x + w, y + h), fill=fill, outline="black")
+                text_lines = text.split("\n")
+                ty = y + (h - len(text_lines) * line_h) // 2
+                for text_line in text_lines:
+                    draw.text((x + TABLE_PAD_PX, ty), text_line, font=f, fill=color)
+                    ty += line_h
+                x += w
+            y += h
+
+        img.save(png_path, dpi=(220, 220))
+        print(f"Saved: {png_path}")
 print("Any BMS Error Analysis DONE ✔")
@@ -1,19 +1,16 @@
 import os
 import re
 import math
+import mmap
+from contextlib import nullcontext
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
-import cantools
-# Lazy import for fast decoder (not available in all cantools versions)
-try:
-    from cantools.database.can import decoder as cantools_decoder  # type: ignore
-except Exception:
-    cantools_decoder = None
-from tqdm import tqdm
-from tkinter import Tk, filedialog
+# cantools, tqdm and tkinter are imported where they are used, so the file
+# dialog comes up without waiting on them
 
 # -------------------------------------------
 # CONFIG
@@ -40,11 +37,13 @@ DISCHARGE_LIMIT_TABLE = [
     (97, 100, 51),
 ]
 
-# Precompiled once for speed
+# Precompiled once for speed; matched as bytes straight over the mapped file,
+# [^\S\n] keeps a match within one line
 TRC_LINE_RE = re.compile(
-    r"^\s*\d+\)\s+(\d{2})-(\d{2})-(\d{4})\s+"
-    r"(\d{2}):(\d{2}):(\d{2})\.(\d{3,4})(?:\.\d+)?\s+\w+\s+"
-    r"([0-9A-Fa-f]+)\s+(\d+)\s+(.*)$"
+    rb"^[^\S\n]*\d+\)[^\S\n]+((\d{2})-(\d{2})-(\d{4}))[^\S\n]+"
+    rb"((\d{2}):(\d{2}):(\d{2}))\.(\d{3,4})(?:\.\d+)?[^\S\n]+\w+[^\S\n]+"
+    rb"([0-9A-Fa-f]+)[^\S\n]+(\d+)(?:[^\S\n]+|(?=\n))(.*)",
+    re.MULTILINE,
 )
 
 
@@ -59,47 +58,53 @@ def is_even_fast(arr):
     return (np.asarray(arr, dtype=np.int64) & 1) == 0
 
 
+# Cell numbers by parity, for set checks on per-row cell lists (masks cover 128 cells)
+ODD_CELLS = frozenset(range(1, 129, 2))
+EVEN_CELLS = frozenset(range(2, 129, 2))
+
+
 # -------------------------------------------
 # Fast TRC -> frames
 # -------------------------------------------
 def parse_trc_fast(path):
     """
     High-throughput TRC parsing:
-      - precompiled regex
+      - precompiled bytes regex over the mmap'ed file (no per-line decode)
       - manual int parsing (no strptime in loop)
-      - only 1 datetime per row (constructor, not strptime)
+      - one datetime per calendar date; times as integer microseconds
     """
     frames = []
-    base_dt = None
-
-    with open(path, "r", encoding="utf8", errors="ignore") as f:
-        for line in f:
-            m = TRC_LINE_RE.match(line)
-            if not m:
-                continue
-
-            # Parse ints directly from regex groups
-            day = int(m.group(1))
-            month = int(m.group(2))
-            year = int(m.group(3))
-            hour = int(m.group(4))
-            minute = int(m.group(5))
-            second = int(m.group(6))
-            ms_str = m.group(7)
+    base_us = None
+    day_us = {}  # date bytes -> microseconds from 0001-01-01 to that midnight
+
+    with open(path, "rb") as f, (
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if os.fstat(f.fileno()).st_size else nullcontext(b"")  # empty files cannot be mapped
+    ) as buf:
+        for m in TRC_LINE_RE.finditer(buf):
+            (date_raw, day, month, year, time_raw, hour, minute, second,
+             ms_raw, id_raw, dlc_raw, data_raw) = m.groups()
+
+            midnight = day_us.get(date_raw)
+            if midnight is None:
+                midnight = datetime(int(year), int(month), int(day)).toordinal() * 86_400_000_000
+                day_us[date_raw] = midnight
             # Interpret captured fraction as microseconds (matches original strptime behavior).
             # len 3 -> "123" -> 123000 µs; len 4 -> "1234" -> 123400 µs
-            micro = int(ms_str.ljust(6, "0")[:6])
+            micro = int(ms_raw.ljust(6, b"0")[:6])
+            ts_us = midnight + ((int(hour) * 60 + int(minute)) * 60 + int(second)) * 1_000_000 + micro
+            if base_us is None:
+                base_us = ts_us
+            t = (ts_us - base_us) / 1_000_000  # == timedelta.total_seconds()
 
-            ts_raw = f"{day:02d}-{month:02d}-{year:04d} {hour:02d}:{minute:02d}:{second:02d}.{ms_str}"
+            ts_raw = f"{date_raw.decode()} {time_raw.decode()}.{ms_raw.decode()}"
 
-            dt = datetime(year, month, day, hour, minute, second, micro)
-            if base_dt is None:
-                base_dt = dt
-            t = (dt - base_dt).total_seconds()
-
-            can_id = int(m.group(8), 16)
-            dlc = int(m.group(9))
-            data = bytes(int(x, 16) for x in m.group(10).split()[:dlc])
+            can_id = int(id_raw, 16)
+            tokens = data_raw.split()[:int(dlc_raw)]
+            try:
+                data = bytes.fromhex(b" ".join(tokens).decode("ascii"))
+            except ValueError:
+                data = bytes(int(x, 16) for x in tokens)  # tokens that are not two-digit hex
 
             frames.append((ts_raw, t, can_id, data))
 
@@ -113,67 +118,150 @@ def parse_trc_fast(path):
 # -------------------------------------------
 # Fast DBC decode -> column-first DataFrame
 # -------------------------------------------
+FRAME_BYTES = 8  # classic CAN payload; longer messages go through cantools
+
+SignalField = namedtuple("SignalField", "name start length signed scale offset is_int choices")
+
+
+@lru_cache(maxsize=None)
+def signal_table(dbc):
+    """
+    frame_id -> (message, fields), fields being one SignalField per signal,
+    or None when the message needs cantools to decode (big-endian, float or
+    multiplexed signals, or more than FRAME_BYTES bytes). Built once per
+    loaded DBC.
+    """
+    table = {}
+    for msg in dbc.messages:
+        fields = []
+        for sig in msg.signals:
+            if sig.byte_order != "little_endian" or sig.is_float or sig.is_multiplexer or sig.multiplexer_ids:
+                fields = None
+                break
+            fields.append(SignalField(
+                sig.name, sig.start, sig.length, sig.is_signed, sig.scale, sig.offset,
+                # cantools keeps integer scale/offset in int arithmetic
+                isinstance(sig.scale, int) and isinstance(sig.offset, int),
+                sig.choices or {},
+            ))
+        if msg.length > FRAME_BYTES:
+            fields = None
+        table[msg.frame_id] = (msg, None if fields is None else tuple(fields))
+    return table
+
+
+def decode_fields(words, fields):
+    """
+    Decode little-endian signals from uint64 payload words (byte 0 lowest),
+    as msg.decode would: ints for integer scaling, floats otherwise, the
+    NamedSignalValue for raw values listed in the signal's choices.
+    Plain float signals come back as float64 arrays, the rest as lists or
+    object arrays.
+    """
+    out = {}
+    for name, start, length, signed, scale, offset, is_int, choices in fields:
+        raw = words >> np.uint64(start)
+        if length < 64:
+            raw &= np.uint64((1 << length) - 1)
+        if signed or length < 64:
+            raw = raw.astype(np.int64)  # two's complement view for 64-bit signals
+        if signed and length < 64:
+            raw -= (raw >> (length - 1)) << length
+        if is_int:
+            vals = (raw * scale + offset).tolist()
+        else:
+            vals = raw.astype(np.float64) * scale + offset
+        if choices:
+            vals = np.array(vals, dtype=object)
+            for key, choice in choices.items():
+                vals[raw == key] = choice
+        out[name] = vals
+    return out
+
+
 def decode_frames_fast(frames, dbc):
     """
     High-speed decode:
-      - cantools Decoder (Cython) if available
-      - frame_id -> message dict lookup (no repeated get)
-      - column-first build via (indices, values) sparse fill to avoid per-row None work
+      - frames grouped by CAN ID, each DBC message decoded once for all its
+        frames from a bit-field table (start, length, sign, scale, offset)
+      - messages the table cannot describe fall back to msg.decode per frame
+      - each message's values assigned straight into NaN-filled per-signal
+        columns by row index: float64 for float signals, object where ints
+        (64-bit masks included) or choice names must be kept as decoded;
+        carrying values forward is left to forward_fill_signals
     """
     total = len(frames)
     if total == 0:
         raise ValueError("No frames to decode.")
 
-    # Prepare decoder and lookup
-    msg_by_id = {msg.frame_id: msg for msg in dbc.messages}
-    try:
-        fast_decoder = cantools_decoder.Decoder(dbc) if cantools_decoder else None
-    except Exception:
-        fast_decoder = None
-
-    # Sparse column storage: col -> (idx list, val list)
-    idx_store = defaultdict(list)
-    val_store = defaultdict(list)
-
-    # Always-present columns
-    idx_store["TimeStr"]
-    val_store["TimeStr"]
-    idx_store["Time"]
-    val_store["Time"]
-    idx_store["can_id"]
-    val_store["can_id"]
-
-    for row_idx, (ts_raw, t, cid, data) in enumerate(tqdm(frames, desc="Decoding", unit="frame")):
-        # Base columns
-        idx_store["TimeStr"].append(row_idx)
-        val_store["TimeStr"].append(ts_raw)
-        idx_store["Time"].append(row_idx)
-        val_store["Time"].append(t)
-        idx_store["can_id"].append(row_idx)
-        val_store["can_id"].append(cid)
-
-        msg = msg_by_id.get(cid)
-        if msg is None:
-            continue
+    from tqdm import tqdm
 
-        try:
-            decoded = fast_decoder.decode_message(cid, data) if fast_decoder else msg.decode(data)
-        except Exception:
-            continue  # skip errors without exceptions per field
+    table = signal_table(dbc)
 
-        for k, v in decoded.items():
-            idx_store[k].append(row_idx)
-            val_store[k].append(v)
+    # Payloads as one little-endian uint64 word per frame (zero-padded)
+    can_ids = np.fromiter((frame[2] for frame in frames), dtype=np.int64, count=total)
+    sizes = np.fromiter((len(frame[3]) for frame in frames), dtype=np.int64, count=total)
+    payload = b"".join(frame[3][:FRAME_BYTES].ljust(FRAME_BYTES, b"\0") for frame in frames)
+    words = np.frombuffer(payload, dtype="<u8")
 
-    # Materialize columns; sparse reindex avoids per-row fill in the hot loop
-    columns = {}
-    row_index = pd.RangeIndex(total)
-    for col, idxs in idx_store.items():
-        vals = val_store[col]
-        series = pd.Series(vals, index=idxs, dtype=object)
-        columns[col] = series.reindex(row_index)
+    # Row numbers of each CAN ID, in frame order
+    order = np.argsort(can_ids, kind="stable")
+    ids, starts = np.unique(can_ids[order], return_index=True)
+    groups = np.split(order, starts[1:])
+
+    # Signal columns, allocated when a signal first decodes, plus the
+    # (row, position in message) each first shows up at, so columns keep the
+    # order a frame-by-frame decode would give them
+    signal_cols = {}
+    first_seen = {}
+
+    for cid, rows in tqdm(zip(ids.tolist(), groups), total=len(ids), desc="Decoding", unit="msg"):
+        entry = table.get(cid)
+        if entry is None:
+            continue
+        msg, fields = entry
 
-    df = pd.DataFrame(columns)
+        # Frames shorter than the message fail to decode and are skipped
+        rows = rows[sizes[rows] >= msg.length]
+        if not len(rows):
+            continue
+
+        if fields is not None:
+            decoded = decode_fields(words[rows], fields)
+        else:
+            decoded = defaultdict(list)
+            kept = []
+            for row_idx in rows.tolist():
+                try:
+                    values = msg.decode(frames[row_idx][3])
+                except Exception:
+                    continue
+                kept.append(row_idx)
+                for k, v in values.items():
+                    decoded[k].append(v)
+            rows = np.asarray(kept, dtype=np.intp)
+
+        first_row = int(rows[0]) if len(rows) else total
+        for pos, (k, vals) in enumerate(decoded.items()):
+            is_float = isinstance(vals, np.ndarray) and vals.dtype == np.float64
+            arr = signal_cols.get(k)
+            if arr is None:
+                arr = signal_cols[k] = np.full(total, np.nan, dtype=np.float64 if is_float else object)
+            elif arr.dtype != object and not is_float:
+                arr = signal_cols[k] = arr.astype(object)  # signal shared with a non-float message
+            arr[rows] = vals
+            first_seen[k] = min(first_seen.get(k, (total, 0)), (first_row, pos))
+
+    # Always-present base columns straight from the frames, then the signals
+    columns = {}
+    for col, pos in (("TimeStr", 0), ("Time", 1), ("can_id", 2)):
+        arr = np.empty(total, dtype=object)
+        arr[:] = [frame[pos] for frame in frames]
+        columns[col] = arr
+    for col in sorted(signal_cols, key=first_seen.get):
+        columns[col] = signal_cols[col]
+
+    df = pd.DataFrame(columns, copy=False)
     if df.empty:
         raise ValueError("❌ DBC decode produced no rows. Check DBC & TRC.")
     return df
@@ -199,225 +287,229 @@ def forward_fill_signals(df):
     base_cols = {"TimeStr", "Time", "can_id"}
     fill_cols = [c for c in df.columns if c not in base_cols]
 
-    # Ensure time ordering before filling
-    if "Time" in df.columns:
+    # Ensure time ordering before filling (a normal log already is)
+    if "Time" in df.columns and not df["Time"].is_monotonic_increasing:
         df = df.sort_values("Time").reset_index(drop=True)
 
-    df[fill_cols] = df[fill_cols].ffill()
+    # ffill in one numpy pass per column: each row takes the value at the
+    # running maximum of the row numbers that carry one
+    rows = np.arange(len(df))
+    for col in fill_cols:
+        vals = df[col].to_numpy()
+        last = np.where(pd.notna(vals), rows, 0)
+        np.maximum.accumulate(last, out=last)
+        df[col] = vals[last]
     return df
 
 
 # -------------------------------------------
 # Dead cells / thermistors (vectorized)
 # -------------------------------------------
+def column_medians(df, cols):
+    """Median of each column, missing or non-numeric values counted as 0, in one pass."""
+    if not cols:
+        return np.empty(0)
+    mat = np.column_stack([numeric_column(df, col) for col in cols])
+    mat[np.isnan(mat)] = 0
+    return np.median(mat, axis=0)
+
+
 def find_dead_cells(df, cells):
-    dead_mask = []
-    for c in cells:
-        col = f"CellVoltage_{c}"
-        if col not in df.columns:
-            continue
-        med = pd.to_numeric(df[col], errors="coerce").fillna(0).median()
-        dead_mask.append((c, med < 5))
-    dead = {c for c, is_dead in dead_mask if is_dead}
+    present = [c for c in cells if f"CellVoltage_{c}" in df.columns]
+    meds = column_medians(df, [f"CellVoltage_{c}" for c in present])
+    dead = {c for c, med in zip(present, meds.tolist()) if med < 5}
     print("Dead cells:", sorted(dead))
     return dead
 
 
 def find_dead_therms(df, zero_threshold=0.1):
-    dead = set()
-    for col in df.columns:
-        if col.startswith("IntTherm_"):
-            med = pd.to_numeric(df[col], errors="coerce").fillna(0).median()
-            if med <= zero_threshold:
-                idx = int(col.split("_")[1])
-                dead.add(idx)
+    therm_cols = [col for col in df.columns if col.startswith("IntTherm_")]
+    meds = column_medians(df, therm_cols)
+    dead = {int(col.split("_")[1]) for col, med in zip(therm_cols, meds.tolist()) if med <= zero_threshold}
     if dead:
         print("Dead thermistors:", sorted(dead))
     return dead
 
 
 # -------------------------------------------
-# Balancing threshold (SoC / mode)
+# Balancing threshold (SoC)
 # -------------------------------------------
-def get_threshold(mode, soc):
-    if mode == "Charging":
-        return 11
-    try:
-        soc_val = float(soc)
-    except Exception:
-        return None
-    for lo, hi, val in DISCHARGE_LIMIT_TABLE:
-        if lo <= soc_val < hi:
-            return val
-    return None
+# Discharge threshold per whole SoC percent (NaN where no band applies); band
+# edges are whole percents, so the floor of a SoC picks its band
+SOC_THRESHOLDS = np.array(
+    [next((val for lo, hi, val in DISCHARGE_LIMIT_TABLE if lo <= pct < hi), np.nan) for pct in range(100)],
+    dtype=np.float64,
+)
+
+
+def soc_threshold(soc):
+    """Discharge threshold for an array of SoC values, NaN outside the table (or for NaN SoC)."""
+    soc = np.asarray(soc, dtype=np.float64)
+    inside = (soc >= 0) & (soc < len(SOC_THRESHOLDS))
+    return np.where(inside, SOC_THRESHOLDS[np.where(inside, soc, 0).astype(np.intp)], np.nan)
 
 
 # -------------------------------------------
 # Decode masks (no try/except in hot path)
 # -------------------------------------------
-def mask_decode(m0, m1):
+MASK64 = (1 << 64) - 1
+
+
+def mask_value(m):
+    """Mask signal as its 64 raw bits (negative values two's complement), 0 if not a number."""
     try:
-        m0i = int(m0)
+        return int(m) & MASK64
     except Exception:
-        m0i = 0
+        return 0
+
+
+def mask_words(vals):
+    """
+    Bulk mask_value: one uint64 per value. Missing values give 0; when every
+    other value converts to int64 the column is converted in one call,
+    otherwise it falls back to mask_value per value.
+    """
+    vals = np.asarray(vals, dtype=object)
+    present = pd.notna(vals)
+    words = np.zeros(len(vals), dtype="<u8")
     try:
-        m1i = int(m1)
-    except Exception:
-        m1i = 0
+        words[present] = np.array(vals[present].tolist(), dtype=np.int64).view(np.uint64)
+    except (TypeError, ValueError, OverflowError):
+        words = np.array([mask_value(m) for m in vals], dtype="<u8")
+    return words
 
-    act = []
-    # unroll in two loops (fast bit checks)
-    for i in range(64):
-        if (m0i >> i) & 1:
-            act.append(i + 1)
-    for i in range(64):
-        if (m1i >> i) & 1:
-            act.append(65 + i)
-    return act
+
+def mask_bits(m0_vals, m1_vals):
+    """Decode both masks: (rows, 128) bool matrix, column i set when cell i + 1 is active."""
+    words = np.column_stack([mask_words(m0_vals), mask_words(m1_vals)]).astype("<u8", copy=False)
+    return np.unpackbits(words.view(np.uint8), axis=1, bitorder="little").astype(bool)
 
 
 # -------------------------------------------
-# Analyze rows (itertuples, column-first output)
+# Analyze rows (vectorized, column-first output)
 # -------------------------------------------
+def numeric_column(df, name):
+    """float64 values of a column; NaN where it is missing or float() would fail."""
+    if name not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=np.float64)
+
+
+def row_lists(hit, labels):
+    """Per row of a boolean matrix, the labels of its True columns (in label order)."""
+    rows, cols = np.nonzero(hit)
+    flat = np.asarray(labels)[cols].tolist()
+    ends = np.cumsum(np.bincount(rows, minlength=hit.shape[0])).tolist()
+    return [flat[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+
 def analyze_fast(df, cells, dead_cells, dead_therms):
+    n = len(df)
+
     # Precompute helpers
     live_cells = [c for c in cells if c not in dead_cells]
     therm_cols = [c for c in df.columns if c.startswith("IntTherm_")]
     live_therm_idxs = [int(c.split("_")[1]) for c in therm_cols if int(c.split("_")[1]) not in dead_therms]
 
-    # Output column stores
+    def values(name):
+        return df[name].tolist() if name in df.columns else [None] * n
+
+    # Mode (from the integer part of Charging_Info)
+    ci = numeric_column(df, "Charging_Info")
+    ci_valid = np.isfinite(ci)
+    ci_int = np.trunc(np.where(ci_valid, ci, 0))
+    mode = np.where(
+        ~ci_valid, "Unknown",
+        np.where(np.isin(ci_int, (1, 17, 33)), "Charging",
+                 np.where(ci_int == 0, "Discharging", "Ready")),
+    )
+    charging = mode == "Charging"
+
+    # Threshold: fixed when charging, else by SoC band (NaN = no threshold)
+    soc = numeric_column(df, "SoC")
+    threshold = soc_threshold(soc)
+    threshold[charging] = 11
+    has_threshold = ~np.isnan(threshold)
+
+    # Temps (live only); like min()/max() over a row, a NaN in the first
+    # thermistor makes both NaN while later NaNs are passed over
+    therm_mat = np.column_stack(
+        [numeric_column(df, f"IntTherm_{idx}") for idx in live_therm_idxs]
+    ) if live_therm_idxs else np.empty((n, 0))
+    temp_block = (therm_mat > TEMP_LIMIT).any(axis=1)
+    if live_therm_idxs:
+        first_nan = np.isnan(therm_mat[:, 0])
+        with np.errstate(invalid="ignore"):
+            pcb_min = np.where(first_nan, np.nan, np.fmin.reduce(therm_mat, axis=1))
+            pcb_max = np.where(first_nan, np.nan, np.fmax.reduce(therm_mat, axis=1))
+        pcb_min, pcb_max = pcb_min.tolist(), pcb_max.tolist()
+    else:
+        pcb_min = pcb_max = [None] * n
+
+    # Required? (any NaN input compares False)
+    vmin = numeric_column(df, "Voltage_Min")
+    vmax = numeric_column(df, "Voltage_Max")
+    bal_limit = numeric_column(df, "Balancing_Limit")
+    required = has_threshold & ~temp_block & (vmin >= bal_limit) & ((vmax - vmin) >= threshold)
+
+    # Required cells: live cells at or above Voltage_Min + threshold
+    cell_mat = np.column_stack(
+        [numeric_column(df, f"CellVoltage_{c}") for c in live_cells]
+    ) if live_cells else np.empty((n, 0))
+    req_hit = (cell_mat >= (vmin + threshold)[:, None]) & required[:, None]
+    req_cells = row_lists(req_hit, live_cells)
+
+    # Active from masks; missing/extra compared per cell number
+    bm0 = values("BalancingMask0")
+    bm1 = values("BalancingMask1")
+    active_hit = mask_bits(bm0, bm1)
+    cell_ids = np.arange(1, max([active_hit.shape[1]] + live_cells) + 1)
+    active_by_cell = np.zeros((n, len(cell_ids)), dtype=bool)
+    active_by_cell[:, :active_hit.shape[1]] = active_hit
+    req_by_cell = np.zeros_like(active_by_cell)
+    req_by_cell[:, np.asarray(live_cells, dtype=np.intp) - 1] = req_hit
+    active_cells = row_lists(active_by_cell, cell_ids)
+    missing = row_lists(req_by_cell & ~active_by_cell, cell_ids)
+    extra = row_lists(active_by_cell & ~req_by_cell, cell_ids)
+
+    # A threshold column holding no NaN is stored as int, as a list of ints would be
+    if has_threshold.all():
+        threshold = threshold.astype(np.int64)
+
     out = {
-        "TimeStr": [], "Time": [], "SoC": [], "Pack_Current": [], "Charging_Info": [],
-        "Flag_Balancing_Active": [], "Balancing_Limit": [], "Voltage_Min": [],
-        "Voltage_Max": [], "Voltage_Delta": [], "BalancingMask0": [], "BalancingMask1": [],
-        "Mode": [], "Threshold": [], "Temp_Block": [], "PCB_Temp_Min": [], "PCB_Temp_Max": [],
-        "Balancing_Required": [], "Required_Cells": [], "Active_Cells": [],
-        "Missing": [], "Extra": [], "Dead_Cells": [], "Dead_Therms": []
+        "TimeStr": values("TimeStr"),
+        "Time": df["Time"].tolist() if "Time" in df.columns else [0.0] * n,
+        "SoC": values("SoC"),
+        "Pack_Current": values("Pack_Current"),
+        "Charging_Info": values("Charging_Info"),
+        "Flag_Balancing_Active": values("Flag_Balancing_Active"),
+        "Balancing_Limit": values("Balancing_Limit"),
+        "Voltage_Min": values("Voltage_Min"),
+        "Voltage_Max": values("Voltage_Max"),
+        "Voltage_Delta": values("Voltage_Delta"),
+        "BalancingMask0": bm0,
+        "BalancingMask1": bm1,
+        "Mode": mode.tolist(),
+        "Threshold": threshold,
+        "Temp_Block": temp_block,
+        "PCB_Temp_Min": pcb_min,
+        "PCB_Temp_Max": pcb_max,
+        "Balancing_Required": np.where(required, "YES", "NO").tolist(),
+        "Required_Cells": req_cells,
+        "Active_Cells": active_cells,
+        "Missing": missing,
+        "Extra": extra,
+        "Dead_Cells": [sorted(dead_cells)] * n,
+        "Dead_Therms": [sorted(dead_therms)] * n,
     }
 
-    # Dynamic cell/therm columns
-    cell_cols = {c: [] for c in live_cells}
-    therm_cols_live = {c: [] for c in live_therm_idxs}
-
-    # Process rows using itertuples (fast attribute access)
-    # Build positional mapping once for tuple lookups
-    columns = list(df.columns)
-    col_idx = {c: i for i, c in enumerate(columns)}
-    get = lambda r, name, default=None: r[col_idx[name]] if name in col_idx else default
-
-    for r in df.itertuples(index=False, name=None):
-        time_str = get(r, "TimeStr")
-        time_val = get(r, "Time", 0.0)
-        soc = get(r, "SoC")
-        pack_current = get(r, "Pack_Current")
-        charging_info = get(r, "Charging_Info")
-        flag_bal = get(r, "Flag_Balancing_Active")
-        bal_limit = get(r, "Balancing_Limit")
-        vmin = get(r, "Voltage_Min")
-        vmax = get(r, "Voltage_Max")
-        vdelta = get(r, "Voltage_Delta")
-        bm0 = get(r, "BalancingMask0")
-        bm1 = get(r, "BalancingMask1")
-
-        # Mode
-        mode = "Unknown"
-        try:
-            ci_int = int(float(charging_info))
-            if ci_int in (1, 17, 33):
-                mode = "Charging"
-            elif ci_int == 0:
-                mode = "Discharging"
-            else:
-                mode = "Ready"
-        except Exception:
-            pass
-
-        threshold = get_threshold(mode, soc)
+    # Live cell voltages and therms, as decoded
+    for c in live_cells:
+        out[f"CellVoltage_{c}"] = values(f"CellVoltage_{c}")
+    for idx in live_therm_idxs:
+        out[f"IntTherm_{idx}"] = values(f"IntTherm_{idx}")
 
-        # Temps (live only)
-        temps = []
-        for col, idx in zip([c for c in therm_cols if int(c.split("_")[1]) in live_therm_idxs], live_therm_idxs):
-            try:
-                temps.append(float(get(r, col)))
-            except Exception:
-                pass
-        temp_block = any(t > TEMP_LIMIT for t in temps)
-        pcb_min = min(temps) if temps else None
-        pcb_max = max(temps) if temps else None
-
-        # Required?
-        required = False
-        try:
-            if vmin is not None and vmax is not None and bal_limit is not None and threshold is not None and not temp_block:
-                if float(vmin) >= float(bal_limit) and (float(vmax) - float(vmin)) >= threshold:
-                    required = True
-        except Exception:
-            pass
-
-        # Required cells
-        req_cells = []
-        if required and vmin is not None and threshold is not None:
-            vmin_f = float(vmin)
-            thr_f = float(threshold)
-            for c in live_cells:
-                col = f"CellVoltage_{c}"
-                val = get(r, col)
-                if val is not None:
-                    try:
-                        if float(val) >= vmin_f + thr_f:
-                            req_cells.append(c)
-                    except Exception:
-                        pass
-
-        # Active from masks
-        active_cells = mask_decode(bm0, bm1)
-        missing = sorted(set(req_cells) - set(active_cells))
-        extra = sorted(set(active_cells) - set(req_cells))
-
-        # Store outputs
-        out["TimeStr"].append(time_str)
-        out["Time"].append(time_val)
-        out["SoC"].append(soc)
-        out["Pack_Current"].append(pack_current)
-        out["Charging_Info"].append(charging_info)
-        out["Flag_Balancing_Active"].append(flag_bal)
-        out["Balancing_Limit"].append(bal_limit)
-        out["Voltage_Min"].append(vmin)
-        out["Voltage_Max"].append(vmax)
-        out["Voltage_Delta"].append(vdelta)
-        out["BalancingMask0"].append(bm0)
-        out["BalancingMask1"].append(bm1)
-        out["Mode"].append(mode)
-        out["Threshold"].append(threshold)
-        out["Temp_Block"].append(temp_block)
-        out["PCB_Temp_Min"].append(pcb_min)
-        out["PCB_Temp_Max"].append(pcb_max)
-        out["Balancing_Required"].append("YES" if required else "NO")
-        out["Required_Cells"].append(req_cells)
-        out["Active_Cells"].append(active_cells)
-        out["Missing"].append(missing)
-        out["Extra"].append(extra)
-        out["Dead_Cells"].append(sorted(dead_cells))
-        out["Dead_Therms"].append(sorted(dead_therms))
-
-        # Live cell voltages
-        for c in live_cells:
-            col = f"CellVoltage_{c}"
-            cell_cols[c].append(get(r, col))
-
-        # Live therms
-        for idx in live_therm_idxs:
-            col = f"IntTherm_{idx}"
-            therm_cols_live[idx].append(get(r, col))
-
-    # Merge all outputs
-    out_df = pd.DataFrame(out)
-    for c, vals in cell_cols.items():
-        out_df[f"CellVoltage_{c}"] = vals
-    for idx, vals in therm_cols_live.items():
-        out_df[f"IntTherm_{idx}"] = vals
-
-    return out_df
+    return pd.DataFrame(out)
 
 
 # -------------------------------------------
@@ -427,7 +519,10 @@ def add_pass_fail_fast(df):
     if df.empty:
         return df
 
-    df = df.sort_values("Time").reset_index(drop=True)
+    # analyze_fast keeps the time order forward_fill_signals established
+    if not df["Time"].is_monotonic_increasing:
+        df = df.sort_values("Time", kind="stable").reset_index(drop=True)
+    times = df["Time"].tolist()
     passfail = ["PASS"] * len(df)
     remark = ["OK"] * len(df)
 
@@ -459,7 +554,7 @@ def add_pass_fail_fast(df):
         if end_idx < current_seg_start_idx:
             return
         start_t = current_seg_start_time
-        end_t = df.at[end_idx, "Time"] if 0 <= end_idx < len(df) else start_t
+        end_t = times[end_idx] if 0 <= end_idx < len(times) else start_t
         duration = max(0.0, end_t - start_t)
         state = current_seg_state
         if state == "ODD" and duration > ODD_EVEN_MAX_ON_SEC:
@@ -501,10 +596,10 @@ def add_pass_fail_fast(df):
         active_cells = row.Active_Cells or []
         missing = row.Missing or []
         extra = row.Extra or []
-        has_req_odd_row = any((c & 1) == 1 for c in req_cells)
-        has_req_even_row = any((c & 1) == 0 for c in req_cells)
-        has_odd_act = any((c & 1) == 1 for c in active_cells)
-        has_even_act = any((c & 1) == 0 for c in active_cells)
+        has_req_odd_row = not ODD_CELLS.isdisjoint(req_cells)
+        has_req_even_row = not EVEN_CELLS.isdisjoint(req_cells)
+        has_odd_act = not ODD_CELLS.isdisjoint(active_cells)
+        has_even_act = not EVEN_CELLS.isdisjoint(active_cells)
 
         # Gap reset
         if prev_t is not None:
@@ -671,6 +766,8 @@ def run(df, path):
 # MAIN
 # -------------------------------------------
 def main():
+    from tkinter import Tk, filedialog
+
     Tk().withdraw()
 
     print("📂 Select TRC")
@@ -685,6 +782,8 @@ def main():
         print(f"❌ balancing.dbc not found at {dbc_path}")
         return
 
+    import cantools
+
     dbc = cantools.database.load_file(dbc_path)
 
     frames = parse_trc_fast(trc)